@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for NaturalLanguageParser.
+
+Run from the repository root: python benchmarks/bench_parser.py
+"""
+
+import timeit
+
+from qa_copilot.bdd.parser import NaturalLanguageParser
+
+DESCRIPTIONS = [
+    "User can login with valid credentials",
+    "User can search with invalid input",
+    "User must be able to add to cart and checkout",
+    'User enters "test@email.com" in email field',
+    "Given the user is logged in when they open settings then the page loads",
+    "unknown action that matches nothing",
+]
+
+
+def bench(label, func, number=20000):
+    per_call = min(timeit.repeat(func, number=number, repeat=5)) / number / len(DESCRIPTIONS)
+    print(f"{label:<24} {per_call * 1e6:6.2f} µs")
+
+
+def main():
+    parser = NaturalLanguageParser()
+    lowered = [description.lower() for description in DESCRIPTIONS]
+
+    bench("parse()", lambda: [parser.parse(d) for d in DESCRIPTIONS])
+    bench("_detect_functionality()", lambda: [parser._detect_functionality(d) for d in lowered])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 # run_test.py - Updated version
 """
 Script to run the feature file with NLP parser
+
+Environment variables:
+    DEBUG_SLOW_MO: milliseconds to pause between browser actions (default 0),
+        e.g. DEBUG_SLOW_MO=2000 to watch the run step by step
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 
@@ -28,7 +33,7 @@ async def main():
         "video_recording": False,
         "parallel_workers": 1,
         "retry_failed_steps": 1,
-        "slow_mo": 2000,
+        "slow_mo": int(os.getenv("DEBUG_SLOW_MO", "0")),
         "devtools": False
     }
 
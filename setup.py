@@ -26,6 +26,7 @@ setup(
     extras_require={
         "ai": ["ollama", "transformers", "torch"],
         "ocr": ["easyocr", "opencv-python"],
+        "speed": ["uvloop; sys_platform != 'win32'", "orjson"],
         "dev": ["pytest", "black", "flake8", "mypy"],
     },
     entry_points={
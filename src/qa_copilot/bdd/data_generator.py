@@ -1,9 +1,36 @@
 from typing import Dict, Any, List
 from faker import Faker
 import random
+import re
 import string
 
 
+# Field type keywords, in priority order: "user_email" is an email field
+_FIELD_TYPE_KEYWORDS = (
+    ("email", ("email", "mail")),
+    ("username", ("user", "username")),
+    ("password", ("pass", "password")),
+    ("phone", ("phone", "mobile", "tel")),
+    ("name", ("name", "first", "last")),
+    ("address", ("address", "street", "city")),
+    ("credit_card", ("card", "credit")),
+    ("date", ("date", "dob", "birth")),
+    ("number", ("number", "amount", "qty")),
+)
+
+# One alternative per type, each searching the whole name, so the first type
+# with a keyword anywhere in the name wins; the matching group names the type
+_FIELD_TYPE_RE = re.compile(
+    "|".join(
+        f"(?:.*?(?P<{field_type}>{'|'.join(map(re.escape, words))}))"
+        for field_type, words in _FIELD_TYPE_KEYWORDS
+    ),
+    re.DOTALL,
+)
+
+_EXAMPLE_ROW_TYPES = ("valid", "invalid", "empty", "edge")
+
+
 class BDDDataGenerator:
     """
     Generates test data for BDD scenarios.
@@ -35,54 +62,29 @@ class BDDDataGenerator:
         Returns:
             List of example dictionaries
         """
+        # Resolve each field's generator once rather than once per row
+        generators = [
+            (field, self.data_patterns.get(self._detect_field_type(field), self._generate_generic))
+            for field in fields
+        ]
+
         examples = []
 
         for i in range(count):
-            example = {}
-            for field in fields:
-                field_type = self._detect_field_type(field)
-                generator = self.data_patterns.get(field_type, self._generate_generic)
-
-                # Generate different types of data
-                if i == 0:  # Valid data
-                    example[field] = generator("valid")
-                elif i == 1:  # Invalid data
-                    example[field] = generator("invalid")
-                elif i == 2:  # Empty data
-                    example[field] = ""
-                elif i == 3:  # Edge case
-                    example[field] = generator("edge")
-                else:  # Random
-                    example[field] = generator("random")
-
-            examples.append(example)
+            # Valid, invalid, empty and edge-case rows first, then random ones
+            data_type = _EXAMPLE_ROW_TYPES[i] if i < len(_EXAMPLE_ROW_TYPES) else "random"
+
+            if data_type == "empty":
+                examples.append(dict.fromkeys(fields, ""))
+            else:
+                examples.append({field: generator(data_type) for field, generator in generators})
 
         return examples
 
     def _detect_field_type(self, field_name: str) -> str:
         """Detect field type from name"""
-        field_lower = field_name.lower()
-
-        if any(word in field_lower for word in ["email", "mail"]):
-            return "email"
-        elif any(word in field_lower for word in ["user", "username"]):
-            return "username"
-        elif any(word in field_lower for word in ["pass", "password"]):
-            return "password"
-        elif any(word in field_lower for word in ["phone", "mobile", "tel"]):
-            return "phone"
-        elif any(word in field_lower for word in ["name", "first", "last"]):
-            return "name"
-        elif any(word in field_lower for word in ["address", "street", "city"]):
-            return "address"
-        elif any(word in field_lower for word in ["card", "credit"]):
-            return "credit_card"
-        elif any(word in field_lower for word in ["date", "dob", "birth"]):
-            return "date"
-        elif any(word in field_lower for word in ["number", "amount", "qty"]):
-            return "number"
-
-        return "generic"
+        match = _FIELD_TYPE_RE.match(field_name.lower())
+        return match.lastgroup if match else "generic"
 
     def _generate_emails(self, data_type: str) -> str:
         """Generate email addresses"""
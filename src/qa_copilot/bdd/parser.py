@@ -7,6 +7,15 @@ class NaturalLanguageParser:
     Parses natural language descriptions into structured BDD components.
     """
 
+    # Compiled once on the class so every parser instance shares them
+    _GIVEN_RE = re.compile(r"given\s+(.+?)(?:when|then|$)", re.IGNORECASE)
+    _VERB_RE = re.compile(r"(?:can|should|must|will)\s+(\w+)")
+    _QUOTED_RE = re.compile(r'"([^"]+)"')
+    _WORD_RE = re.compile(r"\w+")
+
+    # Field names reported as entities whenever the description mentions them
+    _KNOWN_FIELDS = frozenset({"username", "user", "password", "email", "name", "address"})
+
     def __init__(self):
         # Common patterns for different types of functionality
         self.functionality_patterns = {
@@ -58,6 +67,24 @@ class NaturalLanguageParser:
             "special": ["special characters", "special"],
         }
 
+        # Keyword tables flattened for the detection loops. They
+        # are built from the attributes above, so customize those before
+        # parsing, or call _build_keyword_tables() after changing them
+        self._build_keyword_tables()
+
+    def _build_keyword_tables(self) -> None:
+        """Snapshot the functionality and condition keywords for the detection loops"""
+        # Keyword -> functionality type, in priority order; a keyword listed
+        # under several types keeps the first (highest-priority) one
+        self._keyword_to_functionality: Dict[str, str] = {}
+        for func_type, config in self.functionality_patterns.items():
+            for keyword in config["keywords"]:
+                self._keyword_to_functionality.setdefault(keyword, func_type)
+        self._condition_keywords: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (condition_type, tuple(keywords))
+            for condition_type, keywords in self.condition_patterns.items()
+        )
+
     def parse(self, description: str) -> Dict[str, Any]:
         """
         Parse natural language description into BDD components.
@@ -81,10 +108,10 @@ class NaturalLanguageParser:
             "functionality": functionality,
             "feature_name": self._generate_feature_name(description, functionality),
             "scenario_name": self._generate_scenario_name(description),
-            "preconditions": self._extract_preconditions(description, functionality),
-            "actions": self._extract_actions(description),
-            "expectations": self._extract_expectations(description),
-            "entities": self._extract_entities(description, functionality),
+            "preconditions": self._extract_preconditions(description, functionality, desc_lower),
+            "actions": self._extract_actions(desc_lower),
+            "expectations": self._extract_expectations(desc_lower),
+            "entities": self._extract_entities(description, desc_lower, functionality),
             "conditions": self._extract_conditions(desc_lower),
             "data_examples": self._generate_data_examples(functionality),
             "tags": self._generate_tags(functionality, desc_lower),
@@ -94,8 +121,8 @@ class NaturalLanguageParser:
 
     def _detect_functionality(self, description: str) -> str:
         """Detect the type of functionality being described"""
-        for func_type, config in self.functionality_patterns.items():
-            if any(keyword in description for keyword in config["keywords"]):
+        for keyword, func_type in self._keyword_to_functionality.items():
+            if keyword in description:
                 return func_type
         return "generic"
 
@@ -136,7 +163,8 @@ class NaturalLanguageParser:
             return description[0].upper() + description[1:]
         return "Default scenario"
 
-    def _extract_preconditions(self, description: str, functionality: str) -> List[str]:
+    def _extract_preconditions(self, description: str, functionality: str,
+                               desc_lower: str) -> List[str]:
         """Extract preconditions based on functionality"""
         preconditions = []
 
@@ -145,22 +173,21 @@ class NaturalLanguageParser:
             preconditions.extend(self.functionality_patterns[functionality]["preconditions"])
 
         # Look for explicit preconditions in description
-        if "given" in description.lower():
+        if "given" in desc_lower:
             # Extract given conditions
-            given_match = re.search(r"given\s+(.+?)(?:when|then|$)", description, re.IGNORECASE)
+            given_match = self._GIVEN_RE.search(description)
             if given_match:
                 preconditions.append(given_match.group(1).strip())
 
         # Add context-specific preconditions
-        if "logged in" in description.lower() and "the user is logged in" not in preconditions:
+        if "logged in" in desc_lower and "the user is logged in" not in preconditions:
             preconditions.append("the user is logged in")
 
         return preconditions if preconditions else ["the user is on the application"]
 
-    def _extract_actions(self, description: str) -> List[str]:
+    def _extract_actions(self, desc_lower: str) -> List[str]:
         """Extract actions from description"""
         actions = []
-        desc_lower = description.lower()
 
         # Authentication actions
         if "login" in desc_lower or "sign in" in desc_lower:
@@ -204,20 +231,18 @@ class NaturalLanguageParser:
         # Generic action extraction
         else:
             # Try to extract verb phrases
-            verb_pattern = r"(?:can|should|must|will)\s+(\w+)"
-            matches = re.findall(verb_pattern, desc_lower)
+            matches = self._VERB_RE.findall(desc_lower)
             for match in matches:
                 actions.append(f"the user {match}s")
 
         return actions if actions else ["the user performs the action"]
 
-    def _extract_expectations(self, description: str) -> List[str]:
+    def _extract_expectations(self, desc_lower: str) -> List[str]:
         """Extract expected outcomes"""
         expectations = []
-        desc_lower = description.lower()
 
         # Success expectations
-        if any(word in desc_lower for word in ["success", "successful", "valid"]):
+        if "success" in desc_lower or "successful" in desc_lower or "valid" in desc_lower:
             if "login" in desc_lower:
                 expectations.append("the user should see the dashboard")
             elif "register" in desc_lower:
@@ -230,7 +255,7 @@ class NaturalLanguageParser:
                 expectations.append("the action should complete successfully")
 
         # Failure expectations
-        elif any(word in desc_lower for word in ["fail", "error", "invalid"]):
+        elif "fail" in desc_lower or "error" in desc_lower or "invalid" in desc_lower:
             expectations.append('the user should see an error message')
 
         # Validation expectations
@@ -247,7 +272,7 @@ class NaturalLanguageParser:
 
         return expectations
 
-    def _extract_entities(self, description: str, functionality: str) -> List[str]:
+    def _extract_entities(self, description: str, desc_lower: str, functionality: str) -> List[str]:
         """Extract entities mentioned in the description"""
         entities = []
 
@@ -255,21 +280,21 @@ class NaturalLanguageParser:
         if functionality in self.functionality_patterns:
             entities.extend(self.functionality_patterns[functionality]["entities"])
 
-        # Extract specific entities from description
-        # Look for quoted strings
-        quoted_pattern = r'"([^"]+)"'
-        quoted_matches = re.findall(quoted_pattern, description)
-        entities.extend(quoted_matches)
+        # Quoted strings and known field names from the description are entities too
+        entities.extend(self._QUOTED_RE.findall(description))
+        entities.extend(self._KNOWN_FIELDS.intersection(self._WORD_RE.findall(desc_lower)))
 
         return list(set(entities))  # Remove duplicates
 
-    def _extract_conditions(self, description: str) -> List[str]:
+    def _extract_conditions(self, desc_lower: str) -> List[str]:
         """Extract test conditions"""
         conditions = []
 
-        for condition_type, keywords in self.condition_patterns.items():
-            if any(keyword in description for keyword in keywords):
-                conditions.append(condition_type)
+        for condition_type, keywords in self._condition_keywords:
+            for keyword in keywords:
+                if keyword in desc_lower:
+                    conditions.append(condition_type)
+                    break
 
         return conditions
 
@@ -295,7 +320,7 @@ class NaturalLanguageParser:
 
         return examples
 
-    def _generate_tags(self, functionality: str, description: str) -> List[str]:
+    def _generate_tags(self, functionality: str, desc_lower: str) -> List[str]:
         """Generate relevant tags"""
         tags = []
 
@@ -304,15 +329,15 @@ class NaturalLanguageParser:
             tags.append(f"@{functionality}")
 
         # Add priority tags
-        if any(word in description for word in ["critical", "important", "must"]):
+        if "critical" in desc_lower or "important" in desc_lower or "must" in desc_lower:
             tags.append("@critical")
-        elif any(word in description for word in ["should", "normal"]):
+        elif "should" in desc_lower or "normal" in desc_lower:
             tags.append("@normal")
 
         # Add test type tags
-        if "positive" in description or "valid" in description:
+        if "positive" in desc_lower or "valid" in desc_lower:
             tags.append("@positive")
-        elif "negative" in description or "invalid" in description:
+        elif "negative" in desc_lower or "invalid" in desc_lower:
             tags.append("@negative")
 
         # Add automation tag
@@ -2,6 +2,43 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, Template
 
+# Compiled once at import; compiling a Jinja template costs far more than
+# rendering it, and the outline template never changes
+_SCENARIO_OUTLINE_TEMPLATE = Template("""
+Scenario Outline: {{ scenario.name }}
+{%- if scenario.description %}
+  {{ scenario.description }}
+{%- endif %}
+{%- for step in scenario.steps %}
+  {{ step.keyword }} {{ step.text }}
+{%- endfor %}
+
+  Examples:
+{%- for row in table %}
+    {{ row }}
+{%- endfor %}
+""")
+
+
+def _format_examples_table(examples: List[Dict[str, Any]]) -> List[str]:
+    """Format example rows as a Gherkin table with every column padded to its widest cell"""
+    if not examples:
+        return []
+
+    # Columns come from the first row; cells missing from later rows are left empty
+    columns = list(examples[0].keys())
+    widths = [
+        max(len(column), *(len(str(example.get(column, ""))) for example in examples))
+        for column in columns
+    ]
+
+    lines = ["| " + " | ".join(column.ljust(width) for column, width in zip(columns, widths)) + " |"]
+    lines.extend(
+        "| " + " | ".join(str(example.get(column, "")).ljust(width) for column, width in zip(columns, widths)) + " |"
+        for example in examples
+    )
+    return lines
+
 
 class TemplateEngine:
     """
@@ -24,6 +61,10 @@ class TemplateEngine:
             "pytest-bdd": self._get_pytest_bdd_template(),
         }
 
+        # Resolved template per style, so the file lookup and the compile
+        # of a default template happen once rather than on every render
+        self._templates: Dict[str, Template] = {}
+
     def render_feature(self, feature: Dict[str, Any], style: str = "cucumber") -> str:
         """
         Render feature to Gherkin format.
@@ -35,35 +76,25 @@ class TemplateEngine:
         Returns:
             Formatted feature string
         """
-        try:
-            # Try to load template from file
-            template = self.env.get_template(f"{style}.feature.j2")
-        except:
-            # Use default template
-            template_str = self.default_templates.get(style, self.default_templates["cucumber"])
-            template = Template(template_str)
-
-        return template.render(feature=feature)
+        return self._get_template(style).render(feature=feature)
+
+    def _get_template(self, style: str) -> Template:
+        """Get the compiled template for a style, loading it on first use"""
+        template = self._templates.get(style)
+        if template is None:
+            try:
+                # Try to load template from file
+                template = self.env.get_template(f"{style}.feature.j2")
+            except:
+                # Use default template
+                template_str = self.default_templates.get(style, self.default_templates["cucumber"])
+                template = Template(template_str)
+            self._templates[style] = template
+        return template
 
     def render_scenario_outline(self, scenario: Dict[str, Any], examples: List[Dict[str, Any]]) -> str:
         """Render a scenario outline with examples"""
-        template_str = """
-Scenario Outline: {{ scenario.name }}
-{%- if scenario.description %}
-  {{ scenario.description }}
-{%- endif %}
-{%- for step in scenario.steps %}
-  {{ step.keyword }} {{ step.text }}
-{%- endfor %}
-
-  Examples:
-    | {{ examples[0].keys() | join(' | ') }} |
-{%- for example in examples %}
-    | {{ example.values() | join(' | ') }} |
-{%- endfor %}
-"""
-        template = Template(template_str)
-        return template.render(scenario=scenario, examples=examples)
+        return _SCENARIO_OUTLINE_TEMPLATE.render(scenario=scenario, table=_format_examples_table(examples))
 
     def _get_default_template_path(self) -> Path:
         """Get default template directory"""
@@ -241,34 +241,32 @@ class ElementDetector(ConfigurableModule):
 
         start_time = time.time()
 
+        # Check cache first. Locators are bound to their page, so an entry
+        # left by another page with the same URL does not count as a hit
+        cache_key = f"{page.url}:{description}"
+        cached = self._cache.get(cache_key) if self.config.get("cache_elements") else None
+        if cached is not None and cached.page is page:
+            self.logger.info(f"Found element in cache: {description}")
+            return cached
+
         # Parse the description
         parsed = parse_element_description(description)
         logger.info(f"Parsed description: {parsed}")
 
         # Try each strategy
         for attempt in range(self.config.get("retry_count", 3)):
-            for strategy in self.strategies:
-                try:
-                    # Check if strategy supports async
-                    if hasattr(strategy, 'find_async'):
-                        self.logger.debug(f"Trying async strategy: {strategy.name}")
-                        element = await strategy.find_async(page, parsed)
-
-                        if element:
-                            # Verify element is visible and enabled
-                            if await element.is_visible() and await element.is_enabled():
-                                self.logger.info(
-                                    f"Found element using {strategy.name} async strategy "
-                                    f"in {time.time() - start_time:.2f}s"
-                                )
-                                return element
-                            else:
-                                self.logger.debug("Element found but not visible/enabled")
-                    else:
-                        self.logger.debug(f"Strategy {strategy.name} does not support async")
+            # The DOM strategy settles most lookups on its own, so it runs
+            # first and alone; the rest are only started when it misses
+            element = await self._probe_strategies_async(self.strategies[:1], page, parsed, start_time)
+            if element is None:
+                element = await self._probe_strategies_async(self.strategies[1:], page, parsed, start_time)
 
-                except Exception as e:
-                    self.logger.debug(f"Async strategy {strategy.name} failed: {e}")
+            if element is not None:
+                # Cache the result
+                if self.config.get("cache_elements"):
+                    self._cache[cache_key] = element
+
+                return element
 
             # Wait before retry
             if attempt < self.config.get("retry_count", 3) - 1:
@@ -279,6 +277,51 @@ class ElementDetector(ConfigurableModule):
         # If all async strategies fail, try fallback approach
         return await self._fallback_find_async(page, description, parsed, timeout)
 
+    async def _probe_strategies_async(self, strategies: List[Any], page: AsyncPage,
+                                      parsed: Dict[str, Any], start_time: float) -> Optional[AsyncLocator]:
+        """
+        Probe strategies concurrently and return the highest-priority hit.
+        Probes still running once a winner is known are cancelled.
+        """
+        import asyncio
+
+        probes = [
+            asyncio.create_task(self._probe_strategy_async(strategy, page, parsed))
+            for strategy in strategies
+        ]
+        try:
+            for strategy, probe in zip(strategies, probes):
+                element = await probe
+                if element:
+                    self.logger.info(
+                        f"Found element using {strategy.name} async strategy "
+                        f"in {time.time() - start_time:.2f}s"
+                    )
+                    return element
+        finally:
+            for probe in probes:
+                probe.cancel()
+
+        return None
+
+    async def _probe_strategy_async(self, strategy: Any, page: AsyncPage,
+                                    parsed: Dict[str, Any]) -> Optional[AsyncLocator]:
+        """Run one strategy and return its element if it is visible and enabled"""
+        try:
+            self.logger.debug(f"Trying async strategy: {strategy.name}")
+            element = await strategy.find_async(page, parsed)
+
+            if element:
+                # Verify element is visible and enabled
+                if await element.is_visible() and await element.is_enabled():
+                    return element
+                self.logger.debug("Element found but not visible/enabled")
+
+        except Exception as e:
+            self.logger.debug(f"Async strategy {strategy.name} failed: {e}")
+
+        return None
+
     async def _fallback_find_async(self, page: AsyncPage, description: str,
                                    parsed: Dict[str, Any], timeout: int) -> AsyncLocator:
         """Fallback method when strategies don't work"""
@@ -9,6 +9,35 @@ from ..utils import normalize_text, fuzzy_match
 
 logger = logging.getLogger(__name__)
 
+# Element types the role lookup understands, and those with CSS class patterns
+_ROLE_TYPES = ("button", "link", "input", "checkbox", "radio", "dropdown")
+_CSS_PATTERN_TYPES = ("button", "link", "input")
+
+
+def _build_strategy_table() -> Dict[tuple, tuple]:
+    """
+    Map each (element type, has text) shape to the generic strategies worth
+    trying, in priority order. Strategies that return None straight away for
+    a shape are left out, so a miss only pays for lookups that can succeed.
+    """
+    table = {}
+    for element_type in ("", *_ROLE_TYPES):
+        for has_text in (True, False):
+            names = []
+            if has_text:
+                # Kept for inputs too: the sync lookup skips them, but the
+                # async one falls back to *:has-text(...) for them
+                names.extend(["exact_text", "partial_text", "id_or_name", "aria_label"])
+            if has_text or element_type in _CSS_PATTERN_TYPES:
+                names.append("css_patterns")
+            if element_type in _ROLE_TYPES:
+                names.append("role")
+            table[(element_type, has_text)] = tuple(names)
+    return table
+
+
+_STRATEGY_TABLE = _build_strategy_table()
+
 
 class DOMStrategy(DetectionStrategy):
     """
@@ -46,17 +75,11 @@ class DOMStrategy(DetectionStrategy):
             if element:
                 return element
 
-        # Try various strategies
-        strategies = [
-            self._find_by_exact_text_sync,
-            self._find_by_partial_text_sync,
-            self._find_by_id_or_name_sync,
-            self._find_by_aria_label_sync,
-            self._find_by_css_patterns_sync,
-            self._find_by_role_sync,
-        ]
+        # Try the generic strategies that apply to this description's shape
+        shape = (element_type if element_type in _ROLE_TYPES else "", bool(text))
 
-        for strategy in strategies:
+        for strategy_name in _STRATEGY_TABLE[shape]:
+            strategy = getattr(self, f"_find_by_{strategy_name}_sync")
             try:
                 element = strategy(page, element_type, text, attributes)
                 if element and element.count() > 0:
@@ -92,17 +115,11 @@ class DOMStrategy(DetectionStrategy):
             if element:
                 return element
 
-        # Try various strategies
-        strategies = [
-            self._find_by_exact_text_async,
-            self._find_by_partial_text_async,
-            self._find_by_id_or_name_async,
-            self._find_by_aria_label_async,
-            self._find_by_css_patterns_async,
-            self._find_by_role_async,
-        ]
+        # Try the generic strategies that apply to this description's shape
+        shape = (element_type if element_type in _ROLE_TYPES else "", bool(text))
 
-        for strategy in strategies:
+        for strategy_name in _STRATEGY_TABLE[shape]:
+            strategy = getattr(self, f"_find_by_{strategy_name}_async")
             try:
                 element = await strategy(page, element_type, text, attributes)
                 if element and await element.count() > 0:
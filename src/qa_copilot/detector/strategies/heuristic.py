@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from playwright.sync_api import Page as SyncPage, Locator as SyncLocator
 from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
@@ -10,6 +11,19 @@ from ..utils import normalize_text, fuzzy_match
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _matches_variations(text: str, variations: Tuple[str, ...]) -> bool:
+    """
+    Check if text matches any variation. Cached because the same targets are
+    checked against the same patterns on every lookup and fuzzy matching is
+    the slow part.
+    """
+    for variation in variations:
+        if variation in text or fuzzy_match(text, variation, threshold=0.7):
+            return True
+    return False
+
+
 class HeuristicStrategy(DetectionStrategy):
     """
     Enhanced heuristic-based element detection strategy.
@@ -52,6 +66,13 @@ class HeuristicStrategy(DetectionStrategy):
             }
         }
 
+        # Hashable copies of the variation lists, so pattern checks can be
+        # cached; the lists above keep their order for building selectors
+        self._variations: Dict[str, Tuple[str, ...]] = {
+            pattern_name: tuple(pattern_config["variations"])
+            for pattern_name, pattern_config in self.common_patterns.items()
+        }
+
     @property
     def name(self) -> str:
         return "Heuristic"
@@ -76,8 +97,9 @@ class HeuristicStrategy(DetectionStrategy):
                 return element
 
         # Check if text matches any common pattern
+        text_lower = text.lower()
         for pattern_name, pattern_config in self.common_patterns.items():
-            if self._matches_pattern(text.lower(), pattern_config["variations"]):
+            if self._matches_pattern(text_lower, self._variations[pattern_name]):
                 element = self._find_by_pattern_sync(page, pattern_name, pattern_config, description)
                 if element:
                     return element
@@ -115,8 +137,9 @@ class HeuristicStrategy(DetectionStrategy):
                 return element
 
         # Check if text matches any common pattern
+        text_lower = text.lower()
         for pattern_name, pattern_config in self.common_patterns.items():
-            if self._matches_pattern(text.lower(), pattern_config["variations"]):
+            if self._matches_pattern(text_lower, self._variations[pattern_name]):
                 element = await self._find_by_pattern_async(page, pattern_name, pattern_config, description)
                 if element:
                     return element
@@ -140,10 +163,7 @@ class HeuristicStrategy(DetectionStrategy):
 
     def _matches_pattern(self, text: str, variations: List[str]) -> bool:
         """Check if text matches any variation"""
-        for variation in variations:
-            if variation in text or fuzzy_match(text, variation, threshold=0.7):
-                return True
-        return False
+        return _matches_variations(text, tuple(variations))
 
     # Synchronous methods
     def _find_button_with_special_chars_sync(self, page: SyncPage, text: str) -> Optional[SyncLocator]:
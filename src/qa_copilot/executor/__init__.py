@@ -1,8 +1,23 @@
+import os
+import sys
+
 from .executor import TestExecutor, ExecutorConfig
 from .step_definitions import StepDefinitionRegistry, given, when, then
 from .test_context import TestContext
 from .report_collector import ReportCollector
 
+# Optional uvloop event loop (pip install qa-copilot[speed]), opt in with
+# QA_COPILOT_UVLOOP=1. It stays opt-in because some uvloop releases break the
+# pipe transport Playwright uses to talk to its driver. uvloop has no Windows
+# support, so the default asyncio loop is always used there.
+if os.getenv('QA_COPILOT_UVLOOP', '').lower() in ('1', 'true', 'yes') and sys.platform != 'win32':
+    try:
+        import asyncio
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 __all__ = [
     'TestExecutor',
     'ExecutorConfig',
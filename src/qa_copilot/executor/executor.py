@@ -1,8 +1,11 @@
 import asyncio
+import copy
 import os
 import json
 import yaml
-from typing import Dict, List, Any, Optional, Union
+from functools import lru_cache
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Any, Optional, Union
 from pathlib import Path
 from datetime import datetime
 import logging
@@ -11,7 +14,7 @@ from .nlp_step_executor import NLPStepExecutor, NLPStepParser
 
 # Playwright imports
 try:
-    from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+    from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Route
 except ImportError:
     raise ImportError("Playwright is not installed. Run: pip install playwright && playwright install")
 
@@ -80,6 +83,29 @@ from .report_collector import ReportCollector
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built against it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+# Not needed to drive or check the DOM. Stylesheets are kept: without them
+# elements hidden by CSS would count as visible
+_HEAVY_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+
+async def _abort_heavy_resources(route: Route) -> None:
+    """Route handler for light mode"""
+    if route.request.resource_type in _HEAVY_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@lru_cache(maxsize=4)
+def _load_yaml_config(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML config file once per (path, mtime)"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
 
 @dataclass
 class ExecutorConfig:
@@ -97,6 +123,12 @@ class ExecutorConfig:
     base_url: Optional[str] = None
     slow_mo: int = 0
     devtools: bool = False
+    # An already-launched Browser to run scenarios in; it is left open afterwards
+    shared_browser: Optional[Any] = None
+    # Skip downloading images, fonts and media; also enabled by QA_COPILOT_LIGHT_MODE=1
+    light_mode: bool = field(
+        default_factory=lambda: os.getenv('QA_COPILOT_LIGHT_MODE', '').lower() in ('1', 'true', 'yes')
+    )
 
 
 class TestExecutor:
@@ -121,7 +153,7 @@ class TestExecutor:
                 'screenshot_on_failure', 'video_recording',
                 'parallel_workers', 'retry_failed_steps',
                 'environment', 'config_path', 'base_url',
-                'slow_mo', 'devtools'
+                'slow_mo', 'devtools', 'shared_browser', 'light_mode'
             }
 
             # Create ExecutorConfig with only standard fields
@@ -229,15 +261,17 @@ class TestExecutor:
             config_path = Path("config/environments") / f"{self.config.environment}.yaml"
 
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                env_config = yaml.safe_load(f)
-                logger.info(f"Loaded environment config from {config_path}")
+            # The parse is shared between executors; hand each one its own copy
+            env_config = copy.deepcopy(
+                _load_yaml_config(str(config_path), os.path.getmtime(config_path))
+            )
+            logger.info(f"Loaded environment config from {config_path}")
 
-                # Override base_url if provided in env config
-                if 'base_url' in env_config and not self.config.base_url:
-                    self.config.base_url = env_config['base_url']
+            # Override base_url if provided in env config
+            if 'base_url' in env_config and not self.config.base_url:
+                self.config.base_url = env_config['base_url']
 
-                return env_config
+            return env_config
         else:
             logger.warning(f"Environment config not found: {config_path}")
             return {}
@@ -263,8 +297,7 @@ class TestExecutor:
                 # Otherwise, append to base URL only if it's a relative path
                 url = context.base_url.rstrip('/') + '/' + path.lstrip('/')
 
-            await context.page.goto(url)
-            await context.page.wait_for_load_state('networkidle')
+            await context.page.goto(url, wait_until='domcontentloaded')
 
         # Input steps - Enhanced for rich text editors
         @registry.when(r'I enter "([^"]*)" in the "([^"]*)" field')
@@ -323,8 +356,8 @@ class TestExecutor:
             try:
                 element = await context.find_element(f"Click {element_desc}")
                 await element.click()
-                # Wait for potential navigation or dynamic content
-                await context.page.wait_for_load_state('networkidle')
+                # Wait for a navigation, if the click started one
+                await context.page.wait_for_load_state('domcontentloaded')
             except Exception as e:
                 logger.error(f"Failed to click '{element_desc}': {e}")
                 raise Exception(f"Could not click element: {element_desc}")
@@ -360,7 +393,7 @@ class TestExecutor:
                 await search_box.press("Enter")
 
             # Wait for results
-            await context.page.wait_for_load_state('networkidle')
+            await context.page.wait_for_load_state('domcontentloaded')
 
         # Table verification steps
         @registry.then(r'the table should show:')
@@ -432,7 +465,7 @@ class TestExecutor:
             # Try multiple strategies to find the link
             link = await context.find_element(f"Click {link_text} link")
             await link.click()
-            await context.page.wait_for_load_state('networkidle')
+            await context.page.wait_for_load_state('domcontentloaded')
 
         # Text verification steps
         @registry.then(r'I verify text "([^"]*)"')
@@ -490,7 +523,7 @@ class TestExecutor:
                     for selector in dropdown_selectors:
                         try:
                             dropdown = context.page.locator(selector).first
-                            if await dropdown.count() > 0 and await dropdown.is_visible():
+                            if await dropdown.is_visible():
                                 await dropdown.click()
                                 logger.info(f"Clicked dropdown: {selector}")
                                 dropdown_clicked = True
@@ -857,8 +890,7 @@ class TestExecutor:
                     date_obj = DateTimeParser.parse(date_spec)
 
                 # Use date picker handler
-                from utils import DatePickerHandler
-                picker = DatePickerHandler(context.page)
+                picker = context.get_date_picker()
 
                 success = await picker.select_date(field_name, date_obj)
                 if not success:
@@ -886,8 +918,7 @@ class TestExecutor:
                     end_date = DateTimeParser.parse(end_data)
 
                 # Use date picker handler
-                from utils import DatePickerHandler
-                picker = DatePickerHandler(context.page)
+                picker = context.get_date_picker()
 
                 success = await picker.select_date_range(field_name, start_date, end_date)
                 if not success:
@@ -897,14 +928,14 @@ class TestExecutor:
             async def select_date_range_direct(context: TestContext, start_spec: str, end_spec: str,
                                                field_name: str):
                 """Select a date range using direct date specifications"""
-                from utils import DateTimeParser, DatePickerHandler
+                from utils import DateTimeParser
 
                 # Parse the dates
                 start_date = DateTimeParser.parse(start_spec)
                 end_date = DateTimeParser.parse(end_spec)
 
                 # Use date picker handler
-                picker = DatePickerHandler(context.page)
+                picker = context.get_date_picker()
 
                 success = await picker.select_date_range(field_name, start_date, end_date)
                 if not success:
@@ -912,6 +943,11 @@ class TestExecutor:
 
     async def execute_feature(self, feature_path: Union[str, Path]) -> Dict[str, Any]:
         """Execute a single feature file"""
+        return await self._execute_feature(feature_path, self.config.shared_browser)
+
+    async def _execute_feature(self, feature_path: Union[str, Path],
+                               browser: Optional[Browser] = None) -> Dict[str, Any]:
+        """Execute a feature file in the given browser, or in a browser of its own"""
         feature_path = Path(feature_path)
 
         if not feature_path.exists():
@@ -932,28 +968,52 @@ class TestExecutor:
             'status': 'passed'
         }
 
+        if browser is not None:
+            await self._execute_scenarios(browser, feature, result)
+        else:
+            async with self._browser_session() as browser:
+                await self._execute_scenarios(browser, feature, result)
+
+        return result
+
+    @asynccontextmanager
+    async def _browser_session(self) -> AsyncIterator[Browser]:
+        """Start one Playwright driver and browser, closing both afterwards"""
         async with async_playwright() as p:
             # Launch browser
             browser = await self._launch_browser(p)
 
             try:
-                # Execute each scenario
-                for scenario in feature.scenarios:
-                    if self._should_run_scenario(scenario):
-                        scenario_result = await self._execute_scenario(
-                            browser, feature, scenario
-                        )
-                        result['scenarios'].append(scenario_result)
+                yield browser
+            finally:
+                await browser.close()
 
-                        if scenario_result['status'] == 'failed':
-                            result['status'] = 'failed'
+    async def _execute_features(self, feature_files: List[Path]) -> List[Dict[str, Any]]:
+        """Execute feature files in turn, sharing one Playwright driver and browser"""
+        if self.config.shared_browser is not None:
+            return [await self.execute_feature(feature_file) for feature_file in feature_files]
 
-                result['end_time'] = datetime.now().isoformat()
+        feature_results = []
+        async with self._browser_session() as browser:
+            for feature_file in feature_files:
+                logger.info(f"Executing feature: {feature_file}")
+                feature_results.append(await self._execute_feature(feature_file, browser))
 
-            finally:
-                await browser.close()
+        return feature_results
 
-        return result
+    async def _execute_scenarios(self, browser: Browser, feature: Feature, result: Dict[str, Any]) -> None:
+        """Execute the selected scenarios of a feature in the given browser"""
+        for scenario in feature.scenarios:
+            if self._should_run_scenario(scenario):
+                scenario_result = await self._execute_scenario(
+                    browser, feature, scenario
+                )
+                result['scenarios'].append(scenario_result)
+
+                if scenario_result['status'] == 'failed':
+                    result['status'] = 'failed'
+
+        result['end_time'] = datetime.now().isoformat()
 
     async def _launch_browser(self, playwright) -> Browser:
         """Launch browser with configuration"""
@@ -991,6 +1051,9 @@ class TestExecutor:
             record_video_dir="videos/" if self.config.video_recording else None
         )
 
+        if self.config.light_mode:
+            await context.route("**/*", _abort_heavy_resources)
+
         page = await context.new_page()
 
         # Create test context
@@ -1062,8 +1125,8 @@ class TestExecutor:
                 try:
                     exec_result = await nlp_executor.execute_step(step.name)
                     if exec_result['status'] == 'passed':
+                        # Recorded by the finally block below
                         step_result['end_time'] = datetime.now().isoformat()
-                        result['steps'].append(step_result)
                         return
                     elif exec_result['action'] != 'unknown':
                         # Known action but failed
@@ -1159,10 +1222,8 @@ class TestExecutor:
             # TODO: Implement parallel execution
             pass
         else:
-            # Sequential execution
-            for feature_file in feature_files:
-                logger.info(f"Executing feature: {feature_file}")
-                feature_result = asyncio.run(self.execute_feature(feature_file))
+            # Sequential execution, all features in one browser
+            for feature_result in asyncio.run(self._execute_features(feature_files)):
                 results['features'].append(feature_result)
 
                 # Update summary
@@ -3,10 +3,14 @@ Enhanced step executor with improved dropdown handling
 """
 
 import re
+import json
 import time
 import asyncio
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
-from playwright.async_api import Page, Locator
+from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
 from datetime import datetime, timedelta
 import logging
 
@@ -20,6 +24,144 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_IS_VISIBLE_JS = """
+el => {
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 &&
+        getComputedStyle(el).visibility !== 'hidden';
+}
+"""
+
+# Index of the first visible, enabled element that looks clickable, or -1
+_FIRST_CLICKABLE_JS = """
+elements => {
+    const isVisible = %s;
+    return elements.findIndex(el => {
+        if (!isVisible(el) || el.disabled || el.getAttribute('aria-disabled') === 'true') {
+            return false;
+        }
+        const tag = el.tagName.toLowerCase();
+        const role = el.getAttribute('role') || '';
+        const type = el.getAttribute('type') || '';
+        const classes = typeof el.className === 'string' ? el.className : '';
+        return tag === 'button' ||
+               tag === 'a' ||
+               type === 'button' ||
+               type === 'submit' ||
+               role === 'button' ||
+               classes.includes('btn') ||
+               classes.includes('button') ||
+               getComputedStyle(el).cursor === 'pointer';
+    });
+}
+""" % _IS_VISIBLE_JS
+
+# Index of the first visible button whose value or text reads like a login action
+_FIND_LOGIN_BUTTON_JS = """
+elements => {
+    const isVisible = %s;
+    return elements.findIndex(el => {
+        const text = (el.getAttribute('value') || el.textContent || '').toLowerCase();
+        return isVisible(el) && ['sign', 'log', 'submit', 'enter'].some(word => text.includes(word));
+    });
+}
+""" % _IS_VISIBLE_JS
+
+# Writes saved localStorage entries into the current page's origin
+_SET_LOCAL_STORAGE_JS = """
+items => items.forEach(({name, value}) => localStorage.setItem(name, value))
+"""
+
+
+@dataclass(frozen=True)
+class SelectorCandidates:
+    """
+    Alternative ways to locate one element, resolved in a single query.
+
+    The CSS selectors and the texts of button-like elements are joined into
+    one selector list, so the browser checks every candidate at once. Matches
+    come back in document order rather than candidate order, so generic
+    candidates that could shadow specific ones belong in the fallback, which
+    is only tried when nothing here is visible.
+    """
+    css: Tuple[str, ...] = ()
+    texts: Tuple[str, ...] = ()
+    fallback: Optional['SelectorCandidates'] = None
+
+    @cached_property
+    def selector(self) -> str:
+        return ', '.join(self.css + tuple(
+            f':is(button, [role="button"]):has-text("{text}")' for text in self.texts
+        ))
+
+    @cached_property
+    def tiers(self) -> Tuple['SelectorCandidates', ...]:
+        """These candidates followed by each fallback, most specific first"""
+        return (self,) + (self.fallback.tiers if self.fallback else ())
+
+    @cached_property
+    def any_tier_selector(self) -> str:
+        return ', '.join(tier.selector for tier in self.tiers)
+
+    async def first_visible(self, page: Page, timeout: int = 500) -> Optional[Locator]:
+        """Return the first visible candidate, or None"""
+        # One wait covers every tier, so a miss costs a single timeout
+        try:
+            await page.locator(self.any_tier_selector).locator('visible=true').first.wait_for(
+                state='visible', timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            return None
+
+        # Something is visible now; the most specific tier showing it wins
+        for tier in self.tiers:
+            element = page.locator(tier.selector).locator('visible=true').first
+            if await element.count():
+                return element
+        return None
+
+
+_USERNAME_CANDIDATES = SelectorCandidates(
+    css=(
+        'input[name="username"]',
+        'input#username',
+        'input[placeholder*="username" i]',
+        'input[placeholder*="user" i]',
+    ),
+    fallback=SelectorCandidates(css=('input[type="text"]', 'input[type="email"]')),
+)
+
+_PASSWORD_CANDIDATES = SelectorCandidates(css=(
+    'input[type="password"]',
+    'input[name="password"]',
+    'input#password',
+    'input[placeholder*="password" i]',
+))
+
+_SUBMIT_CANDIDATES = SelectorCandidates(
+    css=(
+        'input#kc-login[type="submit"]',
+        'button[type="submit"]',
+        'input[type="submit"]',
+        'input[value="Sign In"]',
+        'input[value="Log In"]',
+        'input[value="Login"]',
+        '.kc-form-buttons input[type="submit"]',
+    ),
+    texts=("Sign In", "Log In", "Login"),
+)
+
+# Links and buttons first; bare text containers only as a last resort
+_CHALLENGES_CANDIDATES = SelectorCandidates(
+    css=(
+        'a:has-text("Challenges")',
+        '[href*="challenges"]',
+        'li:has-text("Challenges") a',
+    ),
+    texts=("Challenges",),
+    fallback=SelectorCandidates(css=('span:has-text("Challenges")', 'div:has-text("Challenges")')),
+)
+
 
 class NLPStepParser:
     """Parse natural language steps into executable actions"""
@@ -235,8 +377,7 @@ class NLPStepExecutor:
             base_url = self.env_config.get('base_url', '')
             url = f"{base_url.rstrip('/')}"
 
-        await self.page.goto(url)
-        await self.page.wait_for_load_state('networkidle')
+        await self.page.goto(url, wait_until='domcontentloaded')
         return {'url': url}
 
     async def _handle_login_as_role(self, params: Dict) -> Any:
@@ -252,33 +393,20 @@ class NLPStepExecutor:
         username = role_config.get('username', '')
         password = role_config.get('password', '')
 
+        # Reuse the session saved by an earlier login as this role, if any
+        state_path = self._auth_state_path(role)
+        if state_path and state_path.exists() and await self._restore_session(state_path):
+            logger.info(f"Restored saved session for role: {role}")
+            return {'logged_in': True, 'role': role, 'restored': True}
+
         # Navigate to login page if not already there
         if 'login' not in self.page.url.lower():
             await self._handle_navigate({'url': 'login page'})
 
         logger.info(f"Filling login form for role: {role}")
 
-        # Look for username field using various selectors
-        username_selectors = [
-            'input[name="username"]',
-            'input[type="text"][name="username"]',
-            'input#username',
-            'input[placeholder*="username" i]',
-            'input[placeholder*="user" i]',
-            'input[type="text"]:visible',
-            'input[type="email"]'
-        ]
-
-        username_field = None
-        for selector in username_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.count() > 0 and await element.is_visible():
-                    username_field = element
-                    logger.info(f"Found username field with selector: {selector}")
-                    break
-            except:
-                continue
+        # Look for username field; specific selectors win over generic inputs
+        username_field = await _USERNAME_CANDIDATES.first_visible(self.page)
 
         if username_field:
             await username_field.fill(username)
@@ -287,23 +415,7 @@ class NLPStepExecutor:
             await self._handle_input({'element': 'Username', 'value': username})
 
         # Look for password field
-        password_selectors = [
-            'input[type="password"]',
-            'input[name="password"]',
-            'input#password',
-            'input[placeholder*="password" i]'
-        ]
-
-        password_field = None
-        for selector in password_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.count() > 0 and await element.is_visible():
-                    password_field = element
-                    logger.info(f"Found password field with selector: {selector}")
-                    break
-            except:
-                continue
+        password_field = await _PASSWORD_CANDIDATES.first_visible(self.page)
 
         if password_field:
             await password_field.fill(password)
@@ -312,42 +424,22 @@ class NLPStepExecutor:
             await self._handle_input({'element': 'Password', 'value': password})
 
         # Find and click the submit button
-        submit_selectors = [
-            'input#kc-login[type="submit"]',
-            'button[type="submit"]',
-            'input[type="submit"]',
-            'button:has-text("Sign In")',
-            'button:has-text("Log In")',
-            'button:has-text("Login")',
-            'input[value="Sign In"]',
-            'input[value="Log In"]',
-            'input[value="Login"]',
-            '.kc-form-buttons input[type="submit"]',
-        ]
-
         clicked = False
-        for selector in submit_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.count() > 0 and await element.is_visible():
-                    await element.click()
-                    logger.info(f"Clicked submit button with selector: {selector}")
-                    clicked = True
-                    break
-            except:
-                continue
+        submit_button = await _SUBMIT_CANDIDATES.first_visible(self.page)
+        if submit_button:
+            await submit_button.click()
+            logger.info("Clicked submit button")
+            clicked = True
 
         if not clicked:
-            # Try to find any visible submit button
+            # Try to find any visible submit button, scanning them all in one pass
             try:
-                buttons = await self.page.locator('button:visible, input[type="submit"]:visible').all()
-                for button in buttons:
-                    text = await button.get_attribute('value') or await button.text_content() or ''
-                    if any(word in text.lower() for word in ['sign', 'log', 'submit', 'enter']):
-                        await button.click()
-                        logger.info(f"Clicked button with text: {text}")
-                        clicked = True
-                        break
+                buttons = self.page.locator('button, input[type="submit"]')
+                i = await buttons.evaluate_all(_FIND_LOGIN_BUTTON_JS)
+                if i >= 0:
+                    await buttons.nth(i).click()
+                    logger.info(f"Clicked login button at index: {i}")
+                    clicked = True
             except:
                 pass
 
@@ -357,14 +449,88 @@ class NLPStepExecutor:
         # Wait for navigation after login
         logger.info("Waiting for navigation after login")
         try:
-            await self.page.wait_for_url(lambda url: 'login' not in url.lower(), timeout=10000)
-        except:
-            await self.page.wait_for_load_state('networkidle')
+            await self.page.wait_for_url(
+                lambda url: 'login' not in url.lower(),
+                wait_until='domcontentloaded',
+                timeout=10000
+            )
+        except PlaywrightTimeoutError:
+            # Some apps log in without leaving the login URL; the form going
+            # away is then the only sign that the submission went through
+            logger.debug("URL did not change after login, waiting for the form to go away")
+            try:
+                await self.page.locator('input[type="password"]').first.wait_for(state='hidden', timeout=10000)
+            except PlaywrightTimeoutError:
+                logger.warning("Login form is still visible after submitting, continuing anyway")
+                # Don't save a session we could not confirm
+                state_path = None
 
-        await asyncio.sleep(2)
+        if state_path:
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            await self.page.context.storage_state(path=str(state_path))
 
         return {'logged_in': True, 'role': role}
 
+    def _auth_state_path(self, role: str) -> Optional[Path]:
+        """Where the session for a role is saved; None unless auth_state_dir is configured"""
+        state_dir = self.env_config.get('auth_state_dir')
+        return Path(state_dir) / f"{role}.json" if state_dir else None
+
+    async def _restore_session(self, state_path: Path) -> bool:
+        """Load a saved storage state into the page's context and check it is still valid"""
+        try:
+            state = json.loads(state_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read saved session {state_path}: {e}")
+            return False
+
+        await self.page.context.add_cookies(state.get('cookies', []))
+
+        # localStorage can only be written from a page on its own origin, so
+        # open the app's origin just far enough to get a document, fill it in,
+        # and only then load the page for real
+        base_url = self.env_config.get('base_url', '').rstrip('/') + '/'
+        origin, local_storage = next((
+            (origin['origin'], origin.get('localStorage', []))
+            for origin in state.get('origins', [])
+            if base_url.startswith(origin['origin'] + '/')
+        ), (None, []))
+        if local_storage:
+            await self.page.goto(origin, wait_until='commit')
+            await self.page.evaluate(_SET_LOCAL_STORAGE_JS, local_storage)
+
+        await self._handle_navigate({'url': 'login page'})
+
+        if await self._session_is_logged_in():
+            return True
+
+        # Don't let a stale session interfere with the form login that follows
+        await self.page.context.clear_cookies()
+        if local_storage:
+            await self.page.evaluate('() => localStorage.clear()')
+        return False
+
+    async def _session_is_logged_in(self) -> bool:
+        """Check whether the page shows the app rather than its login form"""
+        password_field = self.page.locator('input[type="password"]')
+        landmark = self.env_config.get('logged_in_selector')
+
+        if landmark:
+            # Whichever shows up first decides; SPAs render the login form
+            # only after their own session check has run
+            settled = self.page.locator(landmark).or_(password_field).first
+            try:
+                await settled.wait_for(state='visible', timeout=10000)
+            except PlaywrightTimeoutError:
+                return False
+            return not await password_field.first.is_visible()
+
+        # Without a landmark there is nothing to wait for that a valid session
+        # would show, so check once; an SPA that only redirects to its login
+        # form later needs logged_in_selector to be caught here
+        return ('login' not in self.page.url.lower()
+                and not await password_field.first.is_visible())
+
     async def _handle_click(self, params: Dict) -> Any:
         """Handle click actions with improved button detection"""
         element_desc = params.get('element', '')
@@ -403,58 +569,28 @@ class NLPStepExecutor:
             for selector in next_button_selectors:
                 try:
                     elements = self.page.locator(selector)
-                    count = await elements.count()
-
-                    if count > 0:
-                        # Try each matching element
-                        for i in range(count):
-                            element = elements.nth(i)
-
-                            # Verify it's actually visible and enabled
-                            if await element.is_visible() and await element.is_enabled():
-                                # Additional check to ensure it's a clickable element
-                                is_clickable = await element.evaluate("""
-                                    (el) => {
-                                        const tag = el.tagName.toLowerCase();
-                                        const role = el.getAttribute('role') || '';
-                                        const type = el.getAttribute('type') || '';
-                                        const classes = el.className || '';
-                                        const cursor = window.getComputedStyle(el).cursor;
-
-                                        return tag === 'button' || 
-                                               tag === 'a' ||
-                                               type === 'button' || 
-                                               type === 'submit' ||
-                                               role === 'button' ||
-                                               classes.includes('btn') ||
-                                               classes.includes('button') ||
-                                               cursor === 'pointer';
-                                    }
-                                """)
+                    # Check every match in one pass instead of three calls per match
+                    i = await elements.evaluate_all(_FIRST_CLICKABLE_JS)
 
-                                if is_clickable:
-                                    logger.info(f"Found Next button with selector: {selector}, index: {i}")
+                    if i >= 0:
+                        element = elements.nth(i)
+                        logger.info(f"Found Next button with selector: {selector}, index: {i}")
 
-                                    # Scroll into view if needed
-                                    await element.scroll_into_view_if_needed()
+                        # Scroll into view if needed
+                        await element.scroll_into_view_if_needed()
 
-                                    # Small delay to ensure element is ready
-                                    await asyncio.sleep(0.1)
+                        # Small delay to ensure element is ready
+                        await asyncio.sleep(0.1)
 
-                                    # Click the button
-                                    await element.click()
+                        # Click the button
+                        await element.click()
 
-                                    logger.info(f"Successfully clicked Next button")
+                        logger.info(f"Successfully clicked Next button")
 
-                                    # Wait for any navigation or state change
-                                    try:
-                                        # Wait for either navigation or DOM change
-                                        await self.page.wait_for_load_state('networkidle', timeout=5000)
-                                    except:
-                                        # If no navigation, just wait a bit for DOM updates
-                                        await asyncio.sleep(1)
+                        # Wait for a navigation, if the click started one
+                        await self.page.wait_for_load_state('domcontentloaded')
 
-                                    return {'clicked': element_desc}
+                        return {'clicked': element_desc}
 
                 except Exception as e:
                     logger.debug(f"Selector {selector} failed: {e}")
@@ -467,29 +603,13 @@ class NLPStepExecutor:
         try:
             # First try direct selectors for common elements
             if element_desc.lower() == "challenges":
-                selectors = [
-                    'a:has-text("Challenges")',
-                    'button:has-text("Challenges")',
-                    '[href*="challenges"]',
-                    'nav a:has-text("Challenges")',
-                    '.menu a:has-text("Challenges")',
-                    '.sidebar a:has-text("Challenges")',
-                    '[role="navigation"] a:has-text("Challenges")',
-                    'li:has-text("Challenges") a',
-                    'span:has-text("Challenges")',
-                    'div:has-text("Challenges")'
-                ]
-
-                for selector in selectors:
-                    try:
-                        element = self.page.locator(selector).first
-                        if await element.count() > 0 and await element.is_visible():
-                            await element.click()
-                            logger.info(f"Clicked {element_desc} using selector: {selector}")
-                            await self.page.wait_for_load_state('networkidle')
-                            return {'clicked': element_desc}
-                    except:
-                        continue
+                element = await _CHALLENGES_CANDIDATES.first_visible(self.page)
+
+                if element:
+                    await element.click()
+                    logger.info(f"Clicked {element_desc}")
+                    await self.page.wait_for_load_state('domcontentloaded')
+                    return {'clicked': element_desc}
 
             # Fallback to element detector
             element = await self.element_detector.find_async(
@@ -503,11 +623,8 @@ class NLPStepExecutor:
 
             await element.click()
 
-            # Wait for any navigation
-            try:
-                await self.page.wait_for_load_state('networkidle', timeout=3000)
-            except:
-                await asyncio.sleep(0.5)
+            # Wait for a navigation, if the click started one
+            await self.page.wait_for_load_state('domcontentloaded')
 
             return {'clicked': element_desc}
 
@@ -545,7 +662,7 @@ class NLPStepExecutor:
 
                     for editor_sel in editor_selectors:
                         editor = form_item.locator(editor_sel).first
-                        if await editor.count() > 0 and await editor.is_visible():
+                        if await editor.is_visible():
                             logger.info(f"Found editor in form item using: {editor_sel}")
 
                             # Click to focus
@@ -584,26 +701,23 @@ class NLPStepExecutor:
 
             for selector in rich_editor_selectors:
                 try:
-                    elements = self.page.locator(selector)
-                    count = await elements.count()
-                    if count > 0:
-                        element = elements.first
-                        if await element.is_visible():
-                            logger.info(f"Found rich text editor with selector: {selector}")
+                    element = self.page.locator(selector).first
+                    if await element.is_visible():
+                        logger.info(f"Found rich text editor with selector: {selector}")
 
-                            # Click to focus
-                            await element.click()
-                            await asyncio.sleep(0.2)
+                        # Click to focus
+                        await element.click()
+                        await asyncio.sleep(0.2)
 
-                            # Clear existing content
-                            await element.click(click_count=3)  # Triple click to select all
-                            await self.page.keyboard.press('Delete')
+                        # Clear existing content
+                        await element.click(click_count=3)  # Triple click to select all
+                        await self.page.keyboard.press('Delete')
 
-                            # Type new content
-                            await self.page.keyboard.type(value)
+                        # Type new content
+                        await self.page.keyboard.type(value)
 
-                            logger.info("Successfully typed into rich text editor")
-                            return {'typed': value, 'element': element_desc}
+                        logger.info("Successfully typed into rich text editor")
+                        return {'typed': value, 'element': element_desc}
                 except Exception as e:
                     logger.debug(f"Rich text selector {selector} failed: {e}")
                     continue
@@ -672,15 +786,12 @@ class NLPStepExecutor:
             dropdown_clicked = False
             for selector in dropdown_selectors:
                 try:
-                    elements = self.page.locator(selector)
-                    count = await elements.count()
-                    if count > 0:
-                        element = elements.first
-                        if await element.is_visible():
-                            await element.click()
-                            logger.info(f"Clicked dropdown trigger: {selector}")
-                            dropdown_clicked = True
-                            break
+                    element = self.page.locator(selector).first
+                    if await element.is_visible():
+                        await element.click()
+                        logger.info(f"Clicked dropdown trigger: {selector}")
+                        dropdown_clicked = True
+                        break
                 except Exception as e:
                     logger.debug(f"Dropdown selector failed: {selector} - {e}")
                     continue
@@ -6,6 +6,11 @@ from typing import Dict, List, Any, Optional
 import logging
 from jinja2 import Template
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -275,8 +280,12 @@ class ReportCollector:
         """Generate JSON report"""
         report_path = self.output_dir / f"report_{timestamp}.json"
 
-        with open(report_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson is not None:
+            with open(report_path, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(report_path, 'w') as f:
+                json.dump(results, f, indent=2)
 
         logger.info(f"JSON report generated: {report_path}")
         return str(report_path)
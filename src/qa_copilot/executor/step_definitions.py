@@ -37,6 +37,8 @@ class StepDefinitionRegistry:
 
     def __init__(self):
         self.definitions: List[StepDefinition] = []
+        # Same definitions bucketed by keyword, in registration order
+        self._by_keyword: Dict[str, List[StepDefinition]] = {}
         self._keyword_aliases = {
             'and': ['given', 'when', 'then'],
             'but': ['given', 'when', 'then']
@@ -56,6 +58,7 @@ class StepDefinitionRegistry:
         )
 
         self.definitions.append(definition)
+        self._by_keyword.setdefault(definition.keyword, []).append(definition)
         logger.debug(f"Registered step: {keyword} {pattern.pattern}")
 
     def given(self, pattern: str, description: str = ""):
@@ -103,17 +106,16 @@ class StepDefinitionRegistry:
         # Handle And/But keywords
         if keyword in self._keyword_aliases:
             # For And/But, we need to look at the previous step context
-            # For now, try all possible keywords
-            possible_keywords = self._keyword_aliases[keyword]
+            # For now, try every definition, in registration order
+            candidates = self.definitions
         else:
-            possible_keywords = [keyword]
+            candidates = self._by_keyword.get(keyword, [])
 
         # Search for matching definition
-        for definition in self.definitions:
-            if definition.keyword in possible_keywords:
-                if definition.pattern.search(step_text):
-                    logger.debug(f"Found matching step definition: {definition.pattern.pattern}")
-                    return definition
+        for definition in candidates:
+            if definition.pattern.search(step_text):
+                logger.debug(f"Found matching step definition: {definition.pattern.pattern}")
+                return definition
 
         # If no match found, log available patterns for debugging
         logger.warning(f"No step definition found for: {keyword} {step_text}")
@@ -138,6 +140,7 @@ class StepDefinitionRegistry:
     def clear(self):
         """Clear all registered definitions"""
         self.definitions.clear()
+        self._by_keyword.clear()
 
     def register_from_module(self, module):
         """Register all step definitions from a module"""
@@ -27,6 +27,7 @@ class TestContext:
     test_data: Dict[str, Any] = field(default_factory=dict)
     credentials: Dict[str, str] = field(default_factory=dict)
     current_step: Optional[Any] = None
+    _date_picker: Optional[Any] = field(default=None, init=False, repr=False)
 
     def load_credentials(self, env_config: Dict[str, Any]):
         """Load credentials from environment config"""
@@ -173,7 +174,7 @@ class TestContext:
 
     async def wait_for_navigation(self, timeout: Optional[int] = None):
         """Wait for navigation to complete"""
-        await self.page.wait_for_load_state('networkidle', timeout=timeout or self.timeout)
+        await self.page.wait_for_load_state('domcontentloaded', timeout=timeout or self.timeout)
 
     def store_data(self, key: str, value: Any):
         """Store data for use in later steps"""
@@ -329,7 +330,7 @@ class TestContext:
         for selector in rich_selectors:
             try:
                 element = self.page.locator(selector).first
-                if await element.count() > 0 and await element.is_visible():
+                if await element.is_visible():
                     # Click to focus
                     await element.click()
                     await self.page.wait_for_timeout(200)
@@ -364,6 +365,12 @@ class TestContext:
         """Reload the current page"""
         await self.page.reload()
 
+    def get_date_picker(self) -> "DatePickerHandler":
+        """Return the date picker handler for this page, reusing its lookup caches"""
+        if self._date_picker is None:
+            self._date_picker = DatePickerHandler(self.page)
+        return self._date_picker
+
     async def select_date(self, field_description: str, date_description: str):
         """
         Select a date using natural language
@@ -377,7 +384,7 @@ class TestContext:
             date = DateTimeParser.parse(date_description)
 
             # Use date picker handler
-            picker = DatePickerHandler(self.page)
+            picker = self.get_date_picker()
             success = await picker.select_date(field_description, date)
 
             if not success:
@@ -4,21 +4,359 @@ Supports Ant Design, Material UI, and native HTML date pickers
 """
 
 import re
+import time
+import calendar
 import asyncio
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Tuple, Dict, Any, List
-from playwright.async_api import Page, Locator
+from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeoutError, expect
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _days_until(reference_weekday: int, target_weekday: int) -> int:
+    """Days from one weekday (Monday=0) to the next occurrence of another, 1-7"""
+    days_ahead = target_weekday - reference_weekday
+    if days_ahead <= 0:  # Target day already happened this week
+        days_ahead += 7
+    return days_ahead
+
+
+def _months_between(from_year: int, from_month: int, to_year: int, to_month: int) -> int:
+    """Signed number of calendar months from one year/month to another"""
+    return (to_year - from_year) * 12 + to_month - from_month
+
+
+# Patterns used by DateTimeParser.parse
+_RE_RELATIVE_OFFSET = re.compile(r'(\d+)\s*(day|week|month)s?\s*(from\s*now|ago)')
+_RE_NEXT_WEEKDAY = re.compile(r'next\s*(\w+)')
+_RE_TIME_HM = re.compile(r'at\s*(\d{1,2}):(\d{2})\s*(am|pm)')
+_RE_TIME_H = re.compile(r'at\s*(\d{1,2})\s*(am|pm)')
+_RE_DATE_MDY = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})')
+
+# Picker header formats: "December 2024", "Dec 2024", "2024-12", "12/2024"
+_RE_PICKER_HEADER = re.compile(
+    r'(?P<monthname>[A-Za-z]+)\s+(?P<y1>\d{4})'
+    r'|(?P<y2>\d{4})-(?P<m2>\d{1,2})'
+    r'|(?P<m3>\d{1,2})/(?P<y3>\d{4})'
+)
+
+# Common form container patterns, in priority order
+_CONTAINER_SELECTORS = (
+    '.ant-form-item',
+    '.ant-row',
+    '.ant-col',
+    '.form-group',
+    '.field-wrapper',
+    'div[class*="form"]',
+    'div[class*="field"]',
+)
+
+# Form structures that may hold a labelled range picker
+_FORM_STRUCTURE_SELECTORS = (
+    '.ant-form-item',
+    '.ant-row',
+    '.form-group',
+    '.field-wrapper',
+    'div[class*="form"]',
+)
+
+# Common range picker selectors
+_RANGE_PICKER_SELECTORS = (
+    '.ant-picker-range',
+    '.ant-picker:has(input[placeholder*="Start"])',
+    '[class*="range-picker"]',
+    '[class*="date-range"]',
+)
+
+# Any date-related input, used when nothing matches the field name
+_DATE_INPUT_SELECTORS = (
+    'input[type="date"]',
+    'input[type="datetime-local"]',
+    '.ant-picker',
+    '.ant-picker-range',
+    'input[class*="date"]',
+)
+
+# Weekday names -> datetime.weekday() numbers
+_WEEKDAYS = MappingProxyType({
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+})
+
+# Formats tried when typing a date range: ISO, slash, US and EU
+_RANGE_DATE_FORMATS = ('%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y', '%d/%m/%Y')
+
+# Output formats for DateTimeParser.format_for_input
+_DEFAULT_FORMAT = '%Y/%m/%d %H:%M'
+_FORMAT_MAP = MappingProxyType({
+    'default': _DEFAULT_FORMAT,
+    'iso': '%Y-%m-%d',
+    'us': '%m/%d/%Y',
+    'eu': '%d/%m/%Y',
+    'datetime': '%Y-%m-%dT%H:%M',
+    'time': '%H:%M'
+})
+
+# Full and abbreviated month names -> month number
+_MONTH_MAP = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names)
+    if name
+}
+
+# Browser-side helpers so that a whole DOM sweep costs a single round-trip.
+# Matches are returned as (selector, index) pairs and turned back into
+# Locators with page.locator(selector).nth(index).
+_IS_VISIBLE_JS = """
+el => {
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 &&
+        getComputedStyle(el).visibility !== 'hidden';
+}
+"""
+
+# Starts from the labels mentioning the field and walks up to their containers;
+# only scans every container's text when no label matches
+_MATCH_CONTAINERS_JS = """
+([selectors, needle]) => {
+    const hasText = el => (el.innerText || '').toLowerCase().includes(needle);
+    const labels = Array.from(
+        document.querySelectorAll('label, legend, .ant-form-item-label')
+    ).filter(hasText);
+
+    const collect = accept => selectors.flatMap(sel =>
+        Array.from(document.querySelectorAll(sel), (el, index) => ({sel, index, el}))
+            .filter(r => accept(r.sel, r.el))
+            .map(({sel, index}) => ({sel, index}))
+    );
+
+    if (labels.length) {
+        const owners = new Map(selectors.map(sel => [
+            sel, new Set(labels.map(label => label.closest(sel)).filter(Boolean))
+        ]));
+        const matches = collect((sel, el) => owners.get(sel).has(el));
+        if (matches.length) return matches;
+    }
+
+    return collect((sel, el) => hasText(el));
+}
+"""
+
+_FIND_RANGE_IN_CONTAINERS_JS = """
+([selectors, needle]) => {
+    const isVisible = %s;
+    for (const sel of selectors) {
+        const elements = document.querySelectorAll(sel);
+        for (let index = 0; index < elements.length; index++) {
+            const el = elements[index];
+            if (!(el.innerText || '').toLowerCase().includes(needle)) continue;
+
+            const rangePicker = el.querySelector('.ant-picker-range');
+            if (rangePicker && isVisible(rangePicker)) {
+                return {sel, index, inner: '.ant-picker-range'};
+            }
+
+            const picker = el.querySelector('.ant-picker');
+            if (picker && isVisible(picker) && picker.querySelectorAll('input').length >= 2) {
+                return {sel, index, inner: '.ant-picker'};
+            }
+        }
+    }
+    return null;
+}
+""" % _IS_VISIBLE_JS
+
+_FIRST_VISIBLE_JS = """
+selectors => {
+    const isVisible = %s;
+    for (const sel of selectors) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(sel);
+        } catch (e) {
+            continue;
+        }
+        for (let index = 0; index < elements.length; index++) {
+            if (isVisible(elements[index])) return {sel, index};
+        }
+    }
+    return null;
+}
+""" % _IS_VISIBLE_JS
+
+# Mirrors the label-based range picker selectors, in priority order, and
+# returns the index of the first matching picker among all .ant-picker-range
+_FIND_LABELLED_RANGE_PICKER_JS = """
+needle => {
+    const isVisible = %s;
+    // The same labels are checked by several rules; lower-case each text once
+    const texts = new Map();
+    const hasText = el => {
+        if (!texts.has(el)) texts.set(el, (el.innerText || '').toLowerCase());
+        return texts.get(el).includes(needle);
+    };
+    const hasLabel = el => Array.from(el.querySelectorAll('label')).some(hasText);
+    const ancestors = (el, sel) => {
+        const found = [];
+        for (let node = el.parentElement; node; node = node.parentElement) {
+            if (node.matches(sel)) found.push(node);
+        }
+        return found;
+    };
+    const rules = [
+        // .ant-form-item:has(label:has-text(needle)) .ant-picker-range
+        el => ancestors(el, '.ant-form-item').some(hasLabel),
+        // label:has-text(needle) ~ .ant-picker-range
+        el => {
+            for (let sib = el.previousElementSibling; sib; sib = sib.previousElementSibling) {
+                if (sib.matches('label') && hasText(sib)) return true;
+            }
+            return false;
+        },
+        // label:has-text(needle) + div .ant-picker-range
+        el => ancestors(el, 'div').some(div => {
+            const prev = div.previousElementSibling;
+            return prev && prev.matches('label') && hasText(prev);
+        }),
+        // .ant-row / .ant-col containers with the label
+        el => ancestors(el, '.ant-row').some(hasLabel),
+        el => ancestors(el, '.ant-col').some(hasLabel),
+        // Any range picker whose form item / row mentions the field
+        el => {
+            const parent = el.closest('.ant-form-item, .ant-row');
+            return parent ? hasText(parent) : false;
+        },
+    ];
+
+    const pickers = Array.from(document.querySelectorAll('.ant-picker-range'));
+    for (const rule of rules) {
+        const index = pickers.findIndex(el => isVisible(el) && rule(el));
+        if (index !== -1) return index;
+    }
+    return null;
+}
+""" % _IS_VISIBLE_JS
+
+# For each date title, whether an enabled cell for it is rendered in the picker
+_ENABLED_CELLS_JS = """
+(root, titles) => titles.map(title =>
+    !!root.querySelector(`.ant-picker-cell[title="${title}"]:not(.ant-picker-cell-disabled)`)
+)
+"""
+
+_DETECT_PICKER_KIND_JS = """
+el => el.matches('.ant-picker, .ant-picker *') ? 'ant'
+    : el.type === 'date' ? 'native'
+    : el.closest('.MuiPickersPopper, .MuiFormControl') ? 'material'
+    : 'custom'
+"""
+
+# Uses the native value setter so framework-controlled inputs (React) see the change.
+# A candidate counts as accepted only if it is still the live value once the
+# change/blur handlers (and the re-render they schedule) have run; pickers
+# that reject a format reset the input there.
+_SET_FIRST_ACCEPTED_VALUE_JS = """
+async (el, candidates) => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const settle = () => new Promise(resolve => setTimeout(resolve, 50));
+    for (const value of candidates) {
+        setValue.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.dispatchEvent(new FocusEvent('blur'));
+        el.dispatchEvent(new FocusEvent('focusout', {bubbles: true}));
+        await settle();
+        if (el.value === value) return value;
+    }
+    return null;
+}
+"""
+
+_FIND_VISIBLE_RANGE_JS = """
+selectors => {
+    const isVisible = %s;
+    for (const sel of selectors) {
+        // Browsers without :has() support throw on some of the selectors
+        let elements;
+        try {
+            elements = document.querySelectorAll(sel);
+        } catch (e) {
+            continue;
+        }
+        for (let index = 0; index < elements.length; index++) {
+            const el = elements[index];
+            if (isVisible(el) && el.querySelectorAll('input').length >= 2) {
+                return {sel, index};
+            }
+        }
+    }
+    return null;
+}
+""" % _IS_VISIBLE_JS
+
+
 class DatePickerHandler:
     """Handles interaction with various date picker implementations"""
 
+    # How long (in seconds) cached lookups stay valid when no navigation happens
+    CACHE_TTL = 5.0
+
+    # Upper bound (in milliseconds) for waiting on picker UI state changes
+    WAIT_TIMEOUT = 2000
+
     def __init__(self, page: Page):
         self.page = page
 
+        # Lookup caches keyed by (url, field name), cleared on navigation
+        self._container_cache: Dict[Tuple[str, str], Tuple[float, List[Locator]]] = {}
+        self._input_cache: Dict[Tuple[str, str], Tuple[float, Locator]] = {}
+        page.on("framenavigated", lambda _: self._clear_caches())
+
+    def _clear_caches(self) -> None:
+        """Drop all cached lookups (called when the page navigates)"""
+        self._container_cache.clear()
+        self._input_cache.clear()
+
+    def _cache_key(self, needle: str) -> Tuple[str, str]:
+        """Build a cache key for the current page and a lower-cased field name"""
+        return self.page.url, needle
+
+    def _cache_get(self, cache: Dict, key: Tuple[str, str]) -> Any:
+        """Return a cached value if present and not expired"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.CACHE_TTL:
+            del cache[key]
+            return None
+
+        return value
+
+    async def _wait_for_dropdown(self) -> Optional[Locator]:
+        """Wait for a picker dropdown to open and return it (None if it never shows)"""
+        picker = self.page.locator('.ant-picker-dropdown:visible').first
+        try:
+            await picker.wait_for(state='visible', timeout=self.WAIT_TIMEOUT)
+        except PlaywrightTimeoutError:
+            return None
+        return picker
+
+    async def _wait_for_dropdown_closed(self) -> None:
+        """Wait until no picker dropdown is visible any more"""
+        try:
+            await self.page.locator('.ant-picker-dropdown:visible').first.wait_for(
+                state='hidden', timeout=self.WAIT_TIMEOUT
+            )
+        except PlaywrightTimeoutError:
+            logger.debug("Picker dropdown is still open")
+
     async def select_date(self, field_identifier: str, date: datetime) -> bool:
         """
         Select a single date in a date picker
@@ -38,7 +376,6 @@ class DatePickerHandler:
             logger.error(f"Could not find date input for: {field_identifier}")
             return False
 
-        # Try different date picker strategies
         strategies = [
             self._handle_ant_design_picker,
             self._handle_native_date_picker,
@@ -46,6 +383,18 @@ class DatePickerHandler:
             self._handle_custom_date_picker
         ]
 
+        # Dispatch straight to the detected implementation; the remaining
+        # strategies are only tried if it does not handle the field
+        handlers = {
+            'ant': self._handle_ant_design_picker,
+            'native': self._handle_native_date_picker,
+            'material': self._handle_material_date_picker,
+        }
+        detected = handlers.get(await self._detect_picker_kind(date_input))
+        if detected:
+            strategies.remove(detected)
+            strategies.insert(0, detected)
+
         for strategy in strategies:
             try:
                 if await strategy(date_input, date):
@@ -57,6 +406,14 @@ class DatePickerHandler:
 
         return False
 
+    async def _detect_picker_kind(self, date_input: Locator) -> str:
+        """Detect the date picker implementation ('ant', 'native', 'material' or 'custom')"""
+        try:
+            return await date_input.evaluate(_DETECT_PICKER_KIND_JS)
+        except Exception as e:
+            logger.debug(f"Could not detect date picker kind: {e}")
+            return 'custom'
+
     async def select_date_range(self, field_identifier: str, start_date: datetime,
                                 end_date: datetime) -> bool:
         """
@@ -95,122 +452,109 @@ class DatePickerHandler:
         """Find date range picker by label"""
         field_name = field_identifier.replace(" field", "").strip()
 
-        # Try to find the form structure first
-        form_structures = [
-            '.ant-form-item',
-            '.ant-row',
-            '.form-group',
-            '.field-wrapper',
-            'div[class*="form"]',
-        ]
+        # Find the form structure with the label and a visible picker in one round-trip
+        try:
+            match = await self.page.evaluate(
+                _FIND_RANGE_IN_CONTAINERS_JS, [_FORM_STRUCTURE_SELECTORS, field_name.lower()]
+            )
+        except Exception as e:
+            logger.debug(f"Range picker lookup by label failed: {e}")
+            return None
 
-        for structure in form_structures:
-            containers = await self.page.locator(structure).all()
-
-            for container in containers:
-                # Check if this container has our label
-                label_text = await container.inner_text()
-                if field_name.lower() in label_text.lower():
-                    # Look for range picker within this container
-                    range_picker = container.locator('.ant-picker-range').first
-                    if await range_picker.count() > 0 and await range_picker.is_visible():
-                        logger.info(f"Found range picker in container with label: {field_name}")
-                        return range_picker
-
-                    # Also check for regular picker
-                    picker = container.locator('.ant-picker').first
-                    if await picker.count() > 0 and await picker.is_visible():
-                        # Check if it has range inputs
-                        inputs = await picker.locator('input').all()
-                        if len(inputs) >= 2:
-                            logger.info(f"Found picker with multiple inputs in container")
-                            return picker
+        if not match:
+            return None
 
-        return None
+        container = self.page.locator(match['sel']).nth(match['index'])
+        if match['inner'] == '.ant-picker-range':
+            logger.info(f"Found range picker in container with label: {field_name}")
+        else:
+            logger.info(f"Found picker with multiple inputs in container")
+
+        return container.locator(match['inner']).first
 
     async def _find_any_visible_range_picker(self) -> Optional[Locator]:
         """Find any visible range picker on the page"""
-        # Look for common range picker selectors
-        selectors = [
-            '.ant-picker-range:visible',
-            '.ant-picker:has(input[placeholder*="Start"]):visible',
-            '[class*="range-picker"]:visible',
-            '[class*="date-range"]:visible',
-        ]
+        # Look for common range picker selectors (visibility is checked in the browser)
+        try:
+            match = await self.page.evaluate(_FIND_VISIBLE_RANGE_JS, _RANGE_PICKER_SELECTORS)
+        except Exception as e:
+            logger.debug(f"Visible range picker lookup failed: {e}")
+            return None
 
-        for selector in selectors:
-            try:
-                elements = await self.page.locator(selector).all()
-                for elem in elements:
-                    if await elem.is_visible():
-                        # Verify it has multiple inputs
-                        inputs = await elem.locator('input').all()
-                        if len(inputs) >= 2:
-                            logger.info(f"Found visible range picker with selector: {selector}")
-                            return elem
-            except:
-                continue
+        if not match:
+            return None
 
-        return None
+        logger.info(f"Found visible range picker with selector: {match['sel']}")
+        return self.page.locator(match['sel']).nth(match['index'])
 
     async def _fill_date_range(self, range_element: Locator, start_date: datetime,
                                end_date: datetime) -> bool:
         """Fill a date range in the given element"""
 
-        # Get element info
-        tag_name = await range_element.evaluate("el => el.tagName.toLowerCase()")
-        class_name = await range_element.get_attribute('class') or ''
+        # Get element info (independent reads, sent together)
+        tag_name, class_name, input_type = await asyncio.gather(
+            range_element.evaluate("el => el.tagName.toLowerCase()"),
+            range_element.get_attribute('class'),
+            range_element.get_attribute('type'),
+        )
+        class_name = class_name or ''
 
         logger.info(f"Filling date range in element: tag={tag_name}, class={class_name}")
 
+        # Format both dates once for every format we may try
+        formatted = {
+            date_format: (start_date.strftime(date_format), end_date.strftime(date_format))
+            for date_format in _RANGE_DATE_FORMATS
+        }
+
         # Method 1: Direct input filling for range pickers
         if 'picker' in class_name or tag_name == 'div':
             inputs = await range_element.locator('input:visible').all()
 
             if len(inputs) >= 2:
                 try:
-                    # Format dates
-                    date_formats = [
-                        '%Y-%m-%d',  # ISO format
-                        '%Y/%m/%d',  # Slash format
-                        '%m/%d/%Y',  # US format
-                        '%d/%m/%Y',  # EU format
-                    ]
+                    use_keyboard = False
 
                     # Try each format
-                    for date_format in date_formats:
-                        start_str = start_date.strftime(date_format)
-                        end_str = end_date.strftime(date_format)
-
+                    for date_format, (start_str, end_str) in formatted.items():
                         logger.info(f"Trying date format: {date_format}")
 
                         # Fill start date
-                        await inputs[0].click()
-                        await self.page.wait_for_timeout(100)
+                        if not use_keyboard:
+                            await inputs[0].fill(start_str)
+
+                            # Masked inputs reject fill(); type into those instead
+                            use_keyboard = not await inputs[0].input_value()
 
-                        # Clear and type
-                        await self.page.keyboard.press('Control+A')
-                        await self.page.keyboard.press('Delete')
-                        await inputs[0].type(start_str, delay=50)
-                        await self.page.wait_for_timeout(200)
+                        if use_keyboard:
+                            await inputs[0].click()
 
-                        # Move to end date
-                        await self.page.keyboard.press('Tab')
-                        await self.page.wait_for_timeout(200)
+                            # Clear and type
+                            await self.page.keyboard.press('Control+A')
+                            await self.page.keyboard.press('Delete')
+                            await inputs[0].type(start_str, delay=50)
 
-                        # Fill end date
-                        await self.page.keyboard.press('Control+A')
-                        await self.page.keyboard.press('Delete')
-                        await inputs[1].type(end_str, delay=50)
-                        await self.page.wait_for_timeout(200)
+                            # Move to end date
+                            await self.page.keyboard.press('Tab')
+                            await inputs[1].focus()
+
+                            # Clear and type end date
+                            await self.page.keyboard.press('Control+A')
+                            await self.page.keyboard.press('Delete')
+                            await inputs[1].type(end_str, delay=50)
+                        else:
+                            # Fill end date
+                            await inputs[1].fill(end_str)
 
                         # Confirm
                         await self.page.keyboard.press('Enter')
-                        await self.page.wait_for_timeout(500)
+                        await self._wait_for_dropdown_closed()
 
                         # Verify the values were accepted
-                        start_value = await inputs[0].get_attribute('value')
-                        end_value = await inputs[1].get_attribute('value')
+                        start_value, end_value = await asyncio.gather(
+                            inputs[0].get_attribute('value'),
+                            inputs[1].get_attribute('value'),
+                        )
 
                         if start_value and end_value:
                             logger.info(f"Successfully filled range: {start_value} to {end_value}")
@@ -222,7 +566,6 @@ class DatePickerHandler:
             # Method 2: Click to open picker
             try:
                 await range_element.click()
-                await self.page.wait_for_timeout(500)
 
                 if await self._handle_ant_design_range_picker(start_date, end_date):
                     return True
@@ -233,26 +576,38 @@ class DatePickerHandler:
         elif tag_name == 'input':
             try:
                 # Skip if checkbox/radio
-                input_type = await range_element.get_attribute('type')
                 if input_type in ['checkbox', 'radio']:
                     return False
 
                 # Try various range formats
+                iso, slash, us = (formatted[f] for f in ('%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y'))
                 range_formats = [
-                    f"{start_date.strftime('%Y-%m-%d')} - {end_date.strftime('%Y-%m-%d')}",
-                    f"{start_date.strftime('%Y/%m/%d')} - {end_date.strftime('%Y/%m/%d')}",
-                    f"{start_date.strftime('%m/%d/%Y')} - {end_date.strftime('%m/%d/%Y')}",
-                    f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
+                    f"{iso[0]} - {iso[1]}",
+                    f"{slash[0]} - {slash[1]}",
+                    f"{us[0]} - {us[1]}",
+                    f"{iso[0]} to {iso[1]}",
                 ]
 
+                # Try all candidates inside the browser in a single call
+                matched = await range_element.evaluate(_SET_FIRST_ACCEPTED_VALUE_JS, range_formats)
+                if matched:
+                    await range_element.press('Enter')
+                    await self._wait_for_dropdown_closed()
+
+                    value = await range_element.input_value()
+                    if value and value.strip():
+                        logger.info(f"Successfully filled single input with: {matched}")
+                        return True
+
+                # Fall back to filling each candidate through the input
                 for range_text in range_formats:
                     await range_element.click()
                     await range_element.clear()
                     await range_element.fill(range_text)
                     await self.page.keyboard.press('Enter')
-                    await self.page.wait_for_timeout(300)
+                    await self._wait_for_dropdown_closed()
 
-                    value = await range_element.get_attribute('value')
+                    value = await range_element.input_value()
                     if value and value.strip():
                         logger.info(f"Successfully filled single input with: {range_text}")
                         return True
@@ -266,48 +621,16 @@ class DatePickerHandler:
         """Find the date range picker element"""
         field_name = field_identifier.replace(" field", "").strip()
 
-        # Specific selectors for date range pickers
-        selectors = [
-            # Ant Design range picker specific
-            f'.ant-form-item:has(label:has-text("{field_name}")) .ant-picker-range',
-            f'.ant-form-item:has(label:has-text("{field_name}")) div.ant-picker-range',
-            f'label:has-text("{field_name}") ~ .ant-picker-range',
-            f'label:has-text("{field_name}") + div .ant-picker-range',
-
-            # Look for the container with range picker class
-            f'.ant-row:has(label:has-text("{field_name}")) .ant-picker-range',
-            f'.ant-col:has(label:has-text("{field_name}")) .ant-picker-range',
-
-            # Fallback to any range picker if field name matches nearby text
-            '.ant-picker-range',
-        ]
+        # Evaluate all label-based selectors in one round-trip
+        try:
+            index = await self.page.evaluate(_FIND_LABELLED_RANGE_PICKER_JS, field_name.lower())
+        except Exception as e:
+            logger.debug(f"Range picker lookup for '{field_name}' failed: {e}")
+            index = None
 
-        for selector in selectors:
-            try:
-                elements = self.page.locator(selector)
-                count = await elements.count()
-
-                if count > 0:
-                    for i in range(count):
-                        elem = elements.nth(i)
-                        if await elem.is_visible():
-                            # For generic selector, check if it's in the right context
-                            if selector == '.ant-picker-range':
-                                parent_text = await elem.evaluate("""
-                                    (el) => {
-                                        let parent = el.closest('.ant-form-item, .ant-row');
-                                        return parent ? parent.innerText : '';
-                                    }
-                                """)
-
-                                if field_name.lower() not in parent_text.lower():
-                                    continue
-
-                            logger.info(f"Found date range picker using selector: {selector}")
-                            return elem
-            except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
-                continue
+        if index is not None:
+            logger.info(f"Found date range picker for: {field_name}")
+            return self.page.locator('.ant-picker-range').nth(index)
 
         # If no range picker found, fall back to regular date input search
         return await self._find_date_input(field_identifier)
@@ -318,80 +641,93 @@ class DatePickerHandler:
         # Clean the field identifier
         field_name = field_identifier.replace(" field", "").strip()
 
+        key = self._cache_key(field_name.lower())
+        cached = self._cache_get(self._input_cache, key)
+        if cached is not None:
+            return cached
+
+        date_input = await self._locate_date_input(field_name)
+        if date_input is not None:
+            self._input_cache[key] = (time.monotonic(), date_input)
+
+        return date_input
+
+    async def _locate_date_input(self, field_name: str) -> Optional[Locator]:
+        """Locate the date input for an already-cleaned field name"""
+
         # Strategy 1: Find by form structure with label
         containers = await self._find_form_containers_with_label(field_name)
         for container in containers:
-            # Look for inputs within the container
-            inputs = await container.locator('input:not([type="checkbox"]):not([type="radio"]):visible').all()
+            # Look for inputs and picker containers at the same time
+            picker = container.locator('.ant-picker, .ant-picker-range').first
+            inputs, picker_count = await asyncio.gather(
+                container.locator('input:not([type="checkbox"]):not([type="radio"]):visible').all(),
+                picker.count(),
+            )
+
+            # Inputs within the container take priority
             if inputs:
                 return inputs[0]
 
-            # Look for picker containers
-            picker = container.locator('.ant-picker, .ant-picker-range').first
-            if await picker.count() > 0:
+            if picker_count > 0:
                 return picker
 
         # Strategy 2: Find by placeholder
         placeholders = [field_name, "Select date", "Start date", "End date", "Date"]
-        for placeholder in placeholders:
-            input_elem = self.page.locator(f'input[placeholder*="{placeholder}" i]:visible').first
-            if await input_elem.count() > 0:
-                return input_elem
+        selectors = [
+            'input[placeholder*="{}" i]'.format(placeholder.replace('\\', '\\\\').replace('"', '\\"'))
+            for placeholder in placeholders
+        ]
 
         # Strategy 3: Find any date-related input
-        date_selectors = [
-            'input[type="date"]:visible',
-            'input[type="datetime-local"]:visible',
-            '.ant-picker:visible',
-            '.ant-picker-range:visible',
-            'input[class*="date"]:visible',
-        ]
+        selectors.extend(_DATE_INPUT_SELECTORS)
 
-        for selector in date_selectors:
-            elem = self.page.locator(selector).first
-            if await elem.count() > 0:
-                return elem
+        # Check all selectors, in order, in a single round-trip
+        try:
+            match = await self.page.evaluate(_FIRST_VISIBLE_JS, selectors)
+        except Exception as e:
+            logger.debug(f"Date input lookup for '{field_name}' failed: {e}")
+            return None
 
-        return None
+        if not match:
+            return None
+
+        return self.page.locator(match['sel']).nth(match['index'])
 
     async def _find_form_containers_with_label(self, label_text: str) -> List[Locator]:
         """Find form containers that contain the specified label text"""
-        containers = []
-
-        # Common form container patterns
-        container_selectors = [
-            '.ant-form-item',
-            '.ant-row',
-            '.ant-col',
-            '.form-group',
-            '.field-wrapper',
-            'div[class*="form"]',
-            'div[class*="field"]',
-        ]
+        needle = label_text.lower()
+        key = self._cache_key(needle)
+        cached = self._cache_get(self._container_cache, key)
+        if cached is not None:
+            return cached
 
-        for selector in container_selectors:
-            elements = await self.page.locator(selector).all()
-            for elem in elements:
-                try:
-                    text = await elem.inner_text()
-                    if label_text.lower() in text.lower():
-                        containers.append(elem)
-                except:
-                    continue
+        # Match texts inside the browser instead of one inner_text() per element
+        try:
+            matches = await self.page.evaluate(
+                _MATCH_CONTAINERS_JS, [_CONTAINER_SELECTORS, needle]
+            )
+        except Exception as e:
+            logger.debug(f"Container lookup for '{label_text}' failed: {e}")
+            return []
 
+        containers = [self.page.locator(m['sel']).nth(m['index']) for m in matches]
+
+        self._container_cache[key] = (time.monotonic(), containers)
         return containers
 
     async def _handle_ant_design_picker(self, date_input: Locator, date: datetime) -> bool:
         """Handle Ant Design date picker"""
+        iso = date.strftime('%Y-%m-%d')
+
         try:
             # Clear and click the input
             await date_input.clear()
             await date_input.click()
-            await self.page.wait_for_timeout(300)
 
             # Wait for picker popup
-            picker = self.page.locator('.ant-picker-dropdown:visible').first
-            if not await picker.count():
+            picker = await self._wait_for_dropdown()
+            if not picker:
                 return False
 
             # Navigate to correct month/year if needed
@@ -399,17 +735,17 @@ class DatePickerHandler:
 
             # Click the specific date
             date_cell_selector = (
-                f'.ant-picker-cell[title="{date.strftime("%Y-%m-%d")}"]'
+                f'.ant-picker-cell[title="{iso}"]'
                 f':not(.ant-picker-cell-disabled)'
             )
 
-            date_cell = picker.locator(date_cell_selector).first
-            if await date_cell.count() > 0:
-                await date_cell.click()
-                logger.info(f"Clicked date cell: {date.strftime('%Y-%m-%d')}")
+            [has_cell] = await picker.evaluate(_ENABLED_CELLS_JS, [iso])
+            if has_cell:
+                await picker.locator(date_cell_selector).first.click()
+                logger.info(f"Clicked date cell: {iso}")
 
                 # Wait for picker to close
-                await self.page.wait_for_timeout(300)
+                await self._wait_for_dropdown_closed()
                 return True
 
         except Exception as e:
@@ -420,39 +756,48 @@ class DatePickerHandler:
     async def _handle_ant_design_range_picker(self, start_date: datetime,
                                               end_date: datetime) -> bool:
         """Handle Ant Design date range picker popup"""
+        start_iso = start_date.strftime('%Y-%m-%d')
+        end_iso = end_date.strftime('%Y-%m-%d')
+
         try:
             # Wait for the range picker popup
-            picker = self.page.locator('.ant-picker-dropdown:visible').first
-            if not await picker.count():
+            picker = await self._wait_for_dropdown()
+            if not picker:
                 return False
 
-            # Select start date
+            # Show the start month; the twin panel usually shows the end date too
             await self._navigate_to_month(picker, start_date)
 
             start_selector = (
-                f'.ant-picker-cell[title="{start_date.strftime("%Y-%m-%d")}"]'
+                f'.ant-picker-cell[title="{start_iso}"]'
                 f':not(.ant-picker-cell-disabled)'
             )
-            start_cell = picker.locator(start_selector).first
-            if await start_cell.count() > 0:
-                await start_cell.click()
-                logger.info(f"Selected start date: {start_date.strftime('%Y-%m-%d')}")
-                await self.page.wait_for_timeout(300)
-
-            # Select end date
-            await self._navigate_to_month(picker, end_date)
-
             end_selector = (
-                f'.ant-picker-cell[title="{end_date.strftime("%Y-%m-%d")}"]'
+                f'.ant-picker-cell[title="{end_iso}"]'
                 f':not(.ant-picker-cell-disabled)'
             )
+            start_cell = picker.locator(start_selector).first
             end_cell = picker.locator(end_selector).first
-            if await end_cell.count() > 0:
+
+            # Look up both cells in one round-trip (clicks must stay in order)
+            has_start, has_end = await picker.evaluate(_ENABLED_CELLS_JS, [start_iso, end_iso])
+
+            # Select start date
+            if has_start:
+                await start_cell.click()
+                logger.info(f"Selected start date: {start_iso}")
+
+            # Select end date, navigating only if it is not already shown
+            if not has_end:
+                await self._navigate_to_month(picker, end_date)
+                [has_end] = await picker.evaluate(_ENABLED_CELLS_JS, [end_iso])
+
+            if has_end:
                 await end_cell.click()
-                logger.info(f"Selected end date: {end_date.strftime('%Y-%m-%d')}")
+                logger.info(f"Selected end date: {end_iso}")
 
                 # Wait for picker to close
-                await self.page.wait_for_timeout(500)
+                await self._wait_for_dropdown_closed()
                 return True
 
         except Exception as e:
@@ -464,11 +809,14 @@ class DatePickerHandler:
         """Navigate the date picker to show the target month/year"""
         max_attempts = 24  # Prevent infinite loops (2 years)
         attempts = 0
+        jumped = False
+        target_ym = (target_date.year, target_date.month)
 
         while attempts < max_attempts:
             # Get current displayed month/year
             header = picker.locator('.ant-picker-header').first
-            if not await header.count():
+            # Also stops once a failed panel jump had to close the dropdown
+            if not await header.is_visible():
                 break
 
             # Try to find month/year text
@@ -480,48 +828,107 @@ class DatePickerHandler:
                 break
 
             # Check if we're in the right month
-            if (current_date.year == target_date.year and
-                    current_date.month == target_date.month):
+            if (current_date.year, current_date.month) == target_ym:
                 return
 
+            # More than one month away: jump through the year/month panels once
+            months_away = _months_between(current_date.year, current_date.month,
+                                          target_date.year, target_date.month)
+            if abs(months_away) > 1 and not jumped:
+                jumped = True
+                if await self._jump_to_month(picker, target_date):
+                    continue
+
             # Navigate to correct month
             if target_date > current_date:
                 # Go forward
-                next_btn = picker.locator('.ant-picker-header-next-btn').first
-                if await next_btn.count() > 0:
-                    await next_btn.click()
-                    await self.page.wait_for_timeout(200)
+                nav_btn = picker.locator('.ant-picker-header-next-btn').first
             else:
                 # Go backward
-                prev_btn = picker.locator('.ant-picker-header-prev-btn').first
-                if await prev_btn.count() > 0:
-                    await prev_btn.click()
-                    await self.page.wait_for_timeout(200)
+                nav_btn = picker.locator('.ant-picker-header-prev-btn').first
+
+            if await nav_btn.count() > 0:
+                await nav_btn.click()
+
+                # Wait for the header to show the new month
+                try:
+                    await expect(header).not_to_have_text(month_year_text, timeout=self.WAIT_TIMEOUT)
+                except AssertionError:
+                    logger.debug(f"Picker header did not change from: {month_year_text}")
 
             attempts += 1
 
+    async def _jump_to_month(self, picker: Locator, target_date: datetime) -> bool:
+        """Select the target year and month from the picker's year/month panels"""
+        year_btn = picker.locator('.ant-picker-year-btn').first
+        if not await year_btn.count():
+            return False
+
+        try:
+            await year_btn.click()
+
+            # The year panel shows one decade; page through decades if needed
+            year_cell = picker.locator(f'.ant-picker-cell[title="{target_date.year}"]').first
+            for _ in range(10):
+                if await year_cell.count():
+                    break
+
+                first_year = await picker.locator('.ant-picker-cell-in-view').first.get_attribute('title')
+                if int(first_year) < target_date.year:
+                    await picker.locator('.ant-picker-header-super-next-btn').first.click()
+                else:
+                    await picker.locator('.ant-picker-header-super-prev-btn').first.click()
+
+            await year_cell.click(timeout=self.WAIT_TIMEOUT)
+
+            # Some pickers go straight to the month panel after picking a year
+            month_cell = picker.locator(
+                f'.ant-picker-cell[title="{target_date.year}-{target_date.month:02d}"]'
+            ).first
+            if not await month_cell.count():
+                await picker.locator('.ant-picker-month-btn').first.click(timeout=self.WAIT_TIMEOUT)
+
+            await month_cell.click(timeout=self.WAIT_TIMEOUT)
+            return True
+
+        except Exception as e:
+            logger.debug(f"Could not jump to {target_date.strftime('%Y-%m')} via panels: {e}")
+            await self._restore_date_panel(picker)
+            return False
+
+    async def _restore_date_panel(self, picker: Locator) -> None:
+        """Step back down from the decade/year/month panels to the day view"""
+        try:
+            # Picking any cell in those panels opens the next finer one
+            # without selecting a date; decade -> year -> month -> date
+            for _ in range(3):
+                if await picker.locator('.ant-picker-date-panel').count():
+                    return
+                await picker.locator('.ant-picker-cell-in-view').first.click(timeout=self.WAIT_TIMEOUT)
+
+            if await picker.locator('.ant-picker-date-panel').count():
+                return
+        except Exception as e:
+            logger.debug(f"Could not step back to the date panel: {e}")
+
+        # Closing the dropdown resets it to the date panel on the next open
+        await self.page.keyboard.press('Escape')
+
     def _parse_picker_header(self, header_text: str) -> Optional[datetime]:
         """Parse the month/year from picker header text"""
-        # Common formats: "December 2024", "Dec 2024", "2024-12", "12/2024"
-        patterns = [
-            (r'(\w+)\s+(\d{4})', '%B %Y'),  # "December 2024"
-            (r'(\w{3})\s+(\d{4})', '%b %Y'),  # "Dec 2024"
-            (r'(\d{4})-(\d{1,2})', '%Y-%m'),  # "2024-12"
-            (r'(\d{1,2})/(\d{4})', '%m/%Y'),  # "12/2024"
-        ]
+        for match in _RE_PICKER_HEADER.finditer(header_text):
+            if match.group('monthname'):
+                month = _MONTH_MAP.get(match.group('monthname').lower())
+                year = match.group('y1')
+            elif match.group('y2'):
+                month = int(match.group('m2'))
+                year = match.group('y2')
+            else:
+                month = int(match.group('m3'))
+                year = match.group('y3')
 
-        for pattern, date_format in patterns:
-            match = re.search(pattern, header_text)
-            if match:
-                try:
-                    if '%B' in date_format or '%b' in date_format:
-                        # Month name format
-                        return datetime.strptime(match.group(0), date_format)
-                    else:
-                        # Numeric format
-                        return datetime.strptime(match.group(0), date_format)
-                except:
-                    continue
+            if month and 1 <= month <= 12:
+                return datetime(int(year), month, 1)
 
         return None
 
@@ -565,37 +972,79 @@ class DateTimeParser:
         if reference_date is None:
             reference_date = datetime.now()
 
-        description = description.lower().strip()
+        day_offset, weekday, extra_days, time_of_day, date = \
+            DateTimeParser._parse_description(description.lower().strip())
         result = reference_date
 
+        # Handle relative days
+        if day_offset is not None:
+            result = reference_date + timedelta(days=day_offset)
+        elif weekday:
+            result = DateTimeParser._next_weekday(reference_date, weekday)
+
+        # Handle relative weeks/months
+        if extra_days:
+            result = result + timedelta(days=extra_days)
+
+        # Handle specific time
+        if time_of_day:
+            hour, minute = time_of_day
+            result = result.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+        # Handle specific dates
+        if date:
+            year, month, day = date
+            result = result.replace(year=year, month=month, day=day)
+
+        return result
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_description(description: str) -> Tuple:
+        """
+        Extract the parts of a (lower-cased) description that do not depend on
+        the reference date. Cached, since steps keep parsing the same phrases.
+
+        Returns:
+            Tuple of (day_offset, weekday, extra_days, (hour, minute), (year, month, day)),
+            with None for parts the description does not mention
+        """
+        day_offset = weekday = time_of_day = date = None
+        extra_days = 0
+
+        # Cheap substring checks decide which patterns are worth running
+        has_offset = 'from' in description or 'ago' in description
+        has_meridiem = 'am' in description or 'pm' in description
+        has_date = '/' in description or '-' in description
+
+        # Collect "N days/weeks/months from now/ago" offsets in one scan
+        offsets = {}
+        if has_offset:
+            for amount, unit, direction in _RE_RELATIVE_OFFSET.findall(description):
+                if unit not in offsets:
+                    offsets[unit] = int(amount) if direction.startswith('from') else -int(amount)
+
         # Handle relative days
         if "today" in description:
-            result = reference_date
+            day_offset = 0
         elif "tomorrow" in description:
-            result = reference_date + timedelta(days=1)
+            day_offset = 1
         elif "yesterday" in description:
-            result = reference_date - timedelta(days=1)
-        elif match := re.search(r'(\d+)\s*days?\s*from\s*now', description):
-            days = int(match.group(1))
-            result = reference_date + timedelta(days=days)
-        elif match := re.search(r'(\d+)\s*days?\s*ago', description):
-            days = int(match.group(1))
-            result = reference_date - timedelta(days=days)
-        elif match := re.search(r'next\s*(\w+)', description):
-            day_name = match.group(1)
-            result = DateTimeParser._next_weekday(reference_date, day_name)
+            day_offset = -1
+        elif 'day' in offsets:
+            day_offset = offsets['day']
+        elif 'next' in description and (match := _RE_NEXT_WEEKDAY.search(description)):
+            weekday = match.group(1)
 
         # Handle relative weeks/months
-        if match := re.search(r'(\d+)\s*weeks?\s*from\s*now', description):
-            weeks = int(match.group(1))
-            result = result + timedelta(weeks=weeks)
-        elif match := re.search(r'(\d+)\s*months?\s*from\s*now', description):
-            months = int(match.group(1))
+        if 'week' in offsets:
+            extra_days = 7 * offsets['week']
+        elif 'month' in offsets:
             # Approximate month calculation
-            result = result + timedelta(days=30 * months)
+            extra_days = 30 * offsets['month']
 
         # Handle specific time
-        if match := re.search(r'at\s*(\d{1,2}):(\d{2})\s*(am|pm)', description):
+        if has_meridiem and (match := _RE_TIME_HM.search(description)):
             hour = int(match.group(1))
             minute = int(match.group(2))
             meridiem = match.group(3)
@@ -606,8 +1055,8 @@ class DateTimeParser:
             elif meridiem == 'am' and hour == 12:
                 hour = 0
 
-            result = result.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        elif match := re.search(r'at\s*(\d{1,2})\s*(am|pm)', description):
+            time_of_day = (hour, minute)
+        elif has_meridiem and (match := _RE_TIME_H.search(description)):
             hour = int(match.group(1))
             meridiem = match.group(2)
 
@@ -617,10 +1066,10 @@ class DateTimeParser:
             elif meridiem == 'am' and hour == 12:
                 hour = 0
 
-            result = result.replace(hour=hour, minute=0, second=0, microsecond=0)
+            time_of_day = (hour, 0)
 
         # Handle specific dates
-        if match := re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})', description):
+        if has_date and (match := _RE_DATE_MDY.search(description)):
             # Handle MM/DD/YYYY or MM-DD-YYYY format
             month = int(match.group(1))
             day = int(match.group(2))
@@ -630,27 +1079,18 @@ class DateTimeParser:
             if year < 100:
                 year += 2000
 
-            result = result.replace(year=year, month=month, day=day)
+            date = (year, month, day)
 
-        return result
+        return day_offset, weekday, extra_days, time_of_day, date
 
     @staticmethod
     def _next_weekday(reference_date: datetime, weekday_name: str) -> datetime:
         """Get the next occurrence of a weekday"""
-        weekdays = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-
-        target_weekday = weekdays.get(weekday_name.lower())
+        target_weekday = _WEEKDAYS.get(weekday_name.lower())
         if target_weekday is None:
             return reference_date
 
-        days_ahead = target_weekday - reference_date.weekday()
-        if days_ahead <= 0:  # Target day already happened this week
-            days_ahead += 7
-
-        return reference_date + timedelta(days=days_ahead)
+        return reference_date + timedelta(days=_days_until(reference_date.weekday(), target_weekday))
 
     @staticmethod
     def format_for_input(date: datetime, format_type: str = "default") -> str:
@@ -664,13 +1104,4 @@ class DateTimeParser:
         Returns:
             Formatted date string
         """
-        formats = {
-            'default': '%Y/%m/%d %H:%M',
-            'iso': '%Y-%m-%d',
-            'us': '%m/%d/%Y',
-            'eu': '%d/%m/%Y',
-            'datetime': '%Y-%m-%dT%H:%M',
-            'time': '%H:%M'
-        }
-
-        return date.strftime(formats.get(format_type, formats['default']))
\ No newline at end of file
+        return date.strftime(_FORMAT_MAP.get(format_type, _DEFAULT_FORMAT))
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Shared fixtures for tests that drive a real browser.
+
+One Playwright driver and one browser are started for the whole session and
+every test gets a fresh context, so the launch cost is paid once. Tests using
+these fixtures run on the session event loop (mark them with
+``@pytest.mark.asyncio(loop_scope="session")``) and are skipped when the
+Playwright browsers are not installed.
+
+Under pytest-xdist (``pytest -n auto``) every worker runs its own session,
+so each worker launches exactly one browser and never shares it.
+"""
+
+import pytest
+import pytest_asyncio
+from playwright.async_api import async_playwright, Error as PlaywrightError
+from qa_copilot.executor import ExecutorConfig
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser():
+    """Launch one headless Chromium for the test session"""
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(headless=True)
+        except PlaywrightError as e:
+            pytest.skip(f"Playwright browser not available: {e}")
+        yield browser
+        await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def browser_context(browser):
+    """Create an isolated browser context per test"""
+    context = await browser.new_context()
+    yield context
+    await context.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(browser_context):
+    """Open a page in the per-test context"""
+    return await browser_context.new_page()
+
+
+@pytest.fixture
+def executor_config(browser):
+    """Executor config that runs scenarios in the session browser"""
+    return ExecutorConfig(headless=True, shared_browser=browser)
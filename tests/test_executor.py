@@ -1,10 +1,28 @@
 import pytest
 import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from qa_copilot.executor import TestExecutor, ExecutorConfig
-from qa_copilot.executor.test_context import TestContext
+# Aliased so the test classes below do not shadow the classes under test
+from qa_copilot.executor import TestExecutor as Executor, ExecutorConfig
+from qa_copilot.executor.test_context import TestContext as Context
 from qa_copilot.executor.step_definitions import StepDefinitionRegistry
+from qa_copilot.executor.executor import _load_yaml_config
+
+
+class FakePage:
+    """Minimal async page stub that records the calls the steps make"""
+
+    def __init__(self):
+        self.url = 'about:blank'
+        self.goto_calls = []
+
+    async def goto(self, *args, **kwargs):
+        self.goto_calls.append((args, kwargs))
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        pass
 
 
 class TestExecutorConfig:
@@ -18,6 +36,7 @@ class TestExecutorConfig:
         assert config.timeout == 30000
         assert config.environment == "dev"
         assert config.parallel_workers == 1
+        assert config.shared_browser is None
 
     def test_custom_config(self):
         """Test custom configuration"""
@@ -32,6 +51,14 @@ class TestExecutorConfig:
         assert config.timeout == 60000
         assert config.environment == "staging"
 
+    def test_light_mode_from_environment(self, monkeypatch):
+        """Test that light mode can be switched on from the environment"""
+        monkeypatch.delenv('QA_COPILOT_LIGHT_MODE', raising=False)
+        assert ExecutorConfig().light_mode == False
+
+        monkeypatch.setenv('QA_COPILOT_LIGHT_MODE', '1')
+        assert ExecutorConfig().light_mode == True
+
 
 class TestStepDefinitionRegistry:
     """Test StepDefinitionRegistry"""
@@ -83,15 +110,33 @@ class TestStepDefinitionRegistry:
         assert given_def is not None
         assert when_def is not None
 
+    def test_find_definition_by_keyword(self):
+        """Test keyword filtering and And/But fallback to every keyword"""
+        registry = StepDefinitionRegistry()
+
+        @registry.given(r'I am logged in')
+        def logged_in(context):
+            pass
+
+        @registry.then(r'I should see "([^"]*)"')
+        def should_see(context, text):
+            pass
+
+        assert registry.find_step_definition('Given', 'I am logged in').function is logged_in
+        assert registry.find_step_definition('when', 'I am logged in') is None
+        assert registry.find_step_definition('And', 'I should see "Home"').function is should_see
+
+        registry.clear()
+        assert registry.find_step_definition('given', 'I am logged in') is None
+
 
 class TestExecutor:
     """Test TestExecutor class"""
 
     @pytest.fixture
-    def executor(self):
-        """Create test executor instance"""
-        config = ExecutorConfig(headless=True)
-        return TestExecutor(config)
+    def executor(self, executor_config):
+        """Create test executor instance that runs in the session browser"""
+        return Executor(executor_config)
 
     def test_executor_initialization(self, executor):
         """Test executor initialization"""
@@ -108,12 +153,15 @@ class TestExecutor:
         executor.config.browser = "invalid_browser"
         assert executor.validate() == False
 
+    @patch('qa_copilot.executor.executor.os.path.getmtime')
     @patch('qa_copilot.executor.executor.Path.exists')
     @patch('builtins.open')
-    @patch('yaml.safe_load')
-    def test_load_environment_config(self, mock_yaml, mock_open, mock_exists):
+    @patch('yaml.load')
+    def test_load_environment_config(self, mock_yaml, mock_open, mock_exists, mock_getmtime):
         """Test loading environment configuration"""
+        _load_yaml_config.cache_clear()
         mock_exists.return_value = True
+        mock_getmtime.return_value = 0.0
         mock_yaml.return_value = {
             'base_url': 'https://test.example.com',
             'roles': {
@@ -125,7 +173,7 @@ class TestExecutor:
         }
 
         config = ExecutorConfig(environment='test')
-        executor = TestExecutor(config)
+        executor = Executor(config)
 
         assert executor.env_config['base_url'] == 'https://test.example.com'
         assert 'admin' in executor.env_config['roles']
@@ -153,29 +201,73 @@ class TestExecutor:
     @pytest.mark.asyncio
     async def test_execute_step(self, executor):
         """Test step execution"""
-        # Mock page and context
-        mock_page = AsyncMock()
-        mock_page.goto = AsyncMock()
-        mock_page.wait_for_load_state = AsyncMock()
-
-        context = TestContext(
-            page=mock_page,
-            element_detector=Mock(),
+        page = FakePage()
+
+        context = Context(
+            page=page,
+            element_detector=SimpleNamespace(),
             base_url='https://example.com'
         )
 
         # Create a simple step
         from behave.model import Step
-        step = Step('Given', 'Given', 'I navigate to the login page', 1)
+        step = Step('test.feature', 1, 'Given', 'given', 'I navigate to the login page')
 
         # Execute step
-        result = {}
+        result = {'steps': []}
         await executor._execute_step(context, step, result)
 
         # Verify execution
         assert len(result['steps']) == 1
         assert result['steps'][0]['status'] == 'passed'
-        mock_page.goto.assert_called_once()
+        assert len(page.goto_calls) == 1
+
+    @pytest.mark.asyncio
+    @patch('qa_copilot.executor.executor.NLPStepExecutor')
+    async def test_nlp_passed_step_is_recorded_once(self, mock_nlp_executor):
+        """Test that a step the NLP parser handled appears once in the result"""
+        mock_nlp_executor.return_value.execute_step = AsyncMock(
+            return_value={'status': 'passed', 'action': 'navigate'}
+        )
+        executor = Executor(ExecutorConfig(headless=True))
+        executor.use_nlp_parser = True
+        context = Context(
+            page=FakePage(),
+            element_detector=SimpleNamespace(),
+            base_url='https://example.com'
+        )
+
+        from behave.model import Step
+        step = Step('test.feature', 1, 'Given', 'given', 'I navigate to the login page')
+
+        result = {'steps': []}
+        await executor._execute_step(context, step, result)
+
+        assert len(result['steps']) == 1
+        assert result['steps'][0]['status'] == 'passed'
+
+    def test_execute_directory_shares_browser(self, executor, tmp_path):
+        """Test that every feature in a directory runs in one browser session"""
+        for name in ('a.feature', 'b.feature'):
+            (tmp_path / name).write_text('Feature: x')
+
+        browser = object()
+        sessions = []
+
+        @asynccontextmanager
+        async def browser_session():
+            sessions.append(browser)
+            yield browser
+
+        executor._browser_session = browser_session
+        executor._execute_feature = AsyncMock(return_value={'status': 'passed'})
+        executor.report_collector = Mock()
+
+        results = executor.execute_directory(tmp_path)
+
+        assert len(sessions) == 1
+        assert results['summary']['passed'] == 2
+        assert all(call.args[1] is browser for call in executor._execute_feature.call_args_list)
 
 
 class TestContext:
@@ -184,12 +276,9 @@ class TestContext:
     @pytest.fixture
     def context(self):
         """Create test context"""
-        mock_page = AsyncMock()
-        mock_detector = Mock()
-
-        return TestContext(
-            page=mock_page,
-            element_detector=mock_detector,
+        return Context(
+            page=FakePage(),
+            element_detector=SimpleNamespace(),
             base_url='https://example.com'
         )
 
@@ -5,18 +5,23 @@ from qa_copilot.bdd.data_generator import BDDDataGenerator
 class TestBDDDataGenerator:
     """Test BDD Data Generator"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def generator(self):
         return BDDDataGenerator()
 
-    def test_detect_field_type(self, generator):
+    @pytest.mark.parametrize("field_name, field_type", [
+        ("email", "email"),
+        ("user_email", "email"),
+        ("username", "username"),
+        ("password", "password"),
+        ("phone_number", "phone"),
+        ("username_email", "email"),
+        ("card_number", "credit_card"),
+        ("random_field", "generic"),
+    ])
+    def test_detect_field_type(self, generator, field_name, field_type):
         """Test field type detection"""
-        assert generator._detect_field_type("email") == "email"
-        assert generator._detect_field_type("user_email") == "email"
-        assert generator._detect_field_type("username") == "username"
-        assert generator._detect_field_type("password") == "password"
-        assert generator._detect_field_type("phone_number") == "phone"
-        assert generator._detect_field_type("random_field") == "generic"
+        assert generator._detect_field_type(field_name) == field_type
 
     def test_generate_examples(self, generator):
         """Test example generation"""
@@ -5,7 +5,7 @@ from qa_copilot.bdd.expander import TestCaseExpander
 class TestTestCaseExpander:
     """Test Test Case Expander"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def expander(self):
         return TestCaseExpander({
             "include_negative_tests": True,
@@ -47,14 +47,12 @@ class TestTestCaseExpander:
         edge_scenarios = [s for s in scenarios if "@edge" in s.get("tags", [])]
         assert len(edge_scenarios) > 0
 
-    def test_expand_with_different_functionalities(self, expander):
+    @pytest.mark.parametrize("func", ["authentication", "registration", "search", "form", "generic"])
+    def test_expand_with_different_functionalities(self, expander, func):
         """Test expansion for different functionalities"""
-        functionalities = ["authentication", "registration", "search", "form", "generic"]
-
-        for func in functionalities:
-            base = {"name": "Test", "steps": [], "tags": []}
-            parsed = {"functionality": func}
+        base = {"name": "Test", "steps": [], "tags": []}
+        parsed = {"functionality": func}
 
-            scenarios = expander.expand(base, parsed)
-            # Should generate at least some scenarios for each
-            assert isinstance(scenarios, list)
\ No newline at end of file
+        scenarios = expander.expand(base, parsed)
+        # Should generate at least some scenarios for each
+        assert isinstance(scenarios, list)
@@ -6,9 +6,9 @@ from qa_copilot.core import ModuleStatus
 class TestBDDGenerator:
     """Test BDD Generator class"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def generator(self):
-        """Create BDD generator instance"""
+        """Create BDD generator instance, shared by the read-only tests"""
         return BDDGenerator({
             "expansion_level": "medium",
             "include_negative_tests": True,
@@ -49,21 +49,16 @@ class TestBDDGenerator:
         assert "When" in step_keywords
         assert "Then" in step_keywords
 
-    def test_generate_registration_scenario(self, generator):
-        """Test generating registration scenario"""
-        description = "User can register with email and password"
+    @pytest.mark.parametrize("description, feature_name, keyword", [
+        ("User can register with email and password", "User Registration", "register"),
+        ("User can search for products", "Search Functionality", "search"),
+    ])
+    def test_generate_functionality_scenario(self, generator, description, feature_name, keyword):
+        """Test generating registration and search scenarios"""
         feature = generator.generate(description)
 
-        assert feature["name"] == "User Registration"
-        assert any("register" in s["name"].lower() for s in feature["scenarios"])
-
-    def test_generate_search_scenario(self, generator):
-        """Test generating search scenario"""
-        description = "User can search for products"
-        feature = generator.generate(description)
-
-        assert feature["name"] == "Search Functionality"
-        assert any("search" in s["name"].lower() for s in feature["scenarios"])
+        assert feature["name"] == feature_name
+        assert any(keyword in s["name"].lower() for s in feature["scenarios"])
 
     def test_minimal_expansion(self):
         """Test minimal expansion level"""
@@ -18,6 +18,15 @@ class TestNaturalLanguageParser:
         assert parser._detect_functionality("submit form") == "form"
         assert parser._detect_functionality("navigate to page") == "navigation"
         assert parser._detect_functionality("unknown action") == "generic"
+        # Types are checked in priority order, not by keyword position
+        assert parser._detect_functionality("search for the login link") == "authentication"
+
+    def test_detect_functionality_uses_instance_keywords(self, parser):
+        """Test that keyword tables customized on the instance are honoured"""
+        parser.functionality_patterns["search"]["keywords"].append("browse")
+        parser._build_keyword_tables()
+
+        assert parser._detect_functionality("browse the catalogue") == "search"
 
     def test_parse_login_description(self, parser):
         """Test parsing login description"""
@@ -59,4 +68,7 @@ class TestNaturalLanguageParser:
         result = parser.parse("User can login with username and password")
         entities = result["entities"]
         assert "username" in entities or "user" in entities
-        assert "password" in entities
\ No newline at end of file
+        assert "password" in entities
+
+        result = parser.parse("Search customers by name and address.")
+        assert {"name", "address"} <= set(result["entities"])
@@ -71,5 +71,31 @@ class TestTemplateEngine:
 
         assert "Scenario Outline:" in result
         assert "Examples:" in result
-        assert "| username | result |" in result
-        assert "| valid_user | success |" in result
\ No newline at end of file
+        # Columns are padded to their widest cell
+        assert "| username     | result  |" in result
+        assert "| valid_user   | success |" in result
+        assert "| invalid_user | failure |" in result
+
+    def test_render_scenario_outline_with_missing_cells(self, template_engine):
+        """Test that a row missing a column renders an empty cell"""
+        scenario = {
+            "name": "Login with credentials",
+            "steps": [{"keyword": "When", "text": 'user enters "<username>"'}]
+        }
+
+        examples = [
+            {"username": "valid_user", "result": "success"},
+            {"username": "locked_user"}
+        ]
+
+        result = template_engine.render_scenario_outline(scenario, examples)
+
+        assert "| valid_user  | success |" in result
+        assert "| locked_user |         |" in result
+
+    def test_template_is_compiled_once_per_style(self, template_engine, sample_feature):
+        """Test that repeated renders reuse the compiled template"""
+        first = template_engine.render_feature(sample_feature)
+
+        assert template_engine._get_template("cucumber") is template_engine._get_template("cucumber")
+        assert template_engine.render_feature(sample_feature) == first
@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from qa_copilot.detector import ElementDetector
+
+
+class TestElementDetectorAsync:
+    """Test async strategy probing"""
+
+    @pytest.fixture
+    def detector(self):
+        return ElementDetector({"retry_count": 1})
+
+    @pytest.fixture
+    def mock_element(self):
+        """Create mock element that is visible and enabled"""
+        element = Mock()
+        element.is_visible = AsyncMock(return_value=True)
+        element.is_enabled = AsyncMock(return_value=True)
+        return element
+
+    @pytest.fixture
+    def mock_strategies(self):
+        """Create mock DOM, heuristic and OCR strategies that find nothing"""
+        strategies = []
+        for name in ("dom", "heuristic", "ocr"):
+            strategy = Mock()
+            strategy.name = name
+            strategy.find_async = AsyncMock(return_value=None)
+            strategies.append(strategy)
+        return strategies
+
+    @pytest.mark.asyncio
+    async def test_priority_wins_over_speed(self, detector, mock_element, mock_strategies):
+        """Test that a slower, higher-priority fallback still wins"""
+        dom, heuristic, ocr = mock_strategies
+
+        async def slow_hit(page, description):
+            await asyncio.sleep(0.05)
+            return mock_element
+
+        heuristic.find_async.side_effect = slow_hit
+        ocr.find_async.return_value = Mock(
+            is_visible=AsyncMock(return_value=True), is_enabled=AsyncMock(return_value=True)
+        )
+        detector.strategies = mock_strategies
+
+        assert await detector.find_async(Mock(), "Click Login button") is mock_element
+
+    @pytest.mark.asyncio
+    async def test_dom_hit_skips_other_strategies(self, detector, mock_element, mock_strategies):
+        """Test that the other strategies are not started when the DOM one hits"""
+        dom, heuristic, ocr = mock_strategies
+        dom.find_async.return_value = mock_element
+        detector.strategies = mock_strategies
+
+        assert await detector.find_async(Mock(), "Click Login button") is mock_element
+        heuristic.find_async.assert_not_awaited()
+        ocr.find_async.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fallback_strategies_run_concurrently(self, detector, mock_element, mock_strategies):
+        """Test that after a DOM miss one fallback's miss does not delay the next"""
+        dom, heuristic, ocr = mock_strategies
+
+        async def slow_miss(page, description):
+            await asyncio.sleep(0.2)
+            return None
+
+        async def slow_hit(page, description):
+            await asyncio.sleep(0.2)
+            return mock_element
+
+        heuristic.find_async.side_effect = slow_miss
+        ocr.find_async.side_effect = slow_hit
+        detector.strategies = mock_strategies
+
+        start = asyncio.get_running_loop().time()
+        assert await detector.find_async(Mock(), "Click Login button") is mock_element
+        assert asyncio.get_running_loop().time() - start < 0.35
+
+    @pytest.mark.asyncio
+    async def test_results_are_cached_per_page(self, detector, mock_element, mock_strategies):
+        """Test that a repeat lookup on the same page skips the strategies"""
+        page, other_page = Mock(url="https://example.com"), Mock(url="https://example.com")
+        mock_element.page = page
+        dom = mock_strategies[0]
+        dom.find_async.return_value = mock_element
+        detector.strategies = [dom]
+
+        assert await detector.find_async(page, "Click Login button") is mock_element
+        assert await detector.find_async(page, "Click Login button") is mock_element
+        assert dom.find_async.await_count == 1
+
+        await detector.find_async(other_page, "Click Login button")
+        assert dom.find_async.await_count == 2
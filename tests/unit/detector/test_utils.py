@@ -1,107 +1,169 @@
 #!/usr/bin/env python3
 """
 Test script to verify Element Detector is working correctly on real websites
-Save this file in the qa-copilot root directory and run: python test_detector.py
+
+Under pytest the detection cases share the session browser from
+tests/conftest.py, so Chromium is launched once per test process (once per
+worker with pytest-xdist) and every case only opens a fresh context.
+Run this file directly to visit all sites at once in its own browser:
+python tests/unit/detector/test_utils.py
 """
 
-from playwright.sync_api import sync_playwright
+import asyncio
+import os
+import pytest
+from typing import Any, Dict
+from playwright.async_api import async_playwright, BrowserContext
 from qa_copilot.detector import ElementDetector
 import sys
 
+# Set QA_COPILOT_VISUAL=1 to watch the run: a visible browser that
+# highlights every element it finds and pauses on it
+VISUAL = os.environ.get("QA_COPILOT_VISUAL") == "1"
+
+# Tag, text and visibility of an element in one round trip; visibility
+# follows Playwright's rule of a non-empty box that is not visibility:hidden
+ELEMENT_INFO_JS = """
+el => {
+    const rect = el.getBoundingClientRect();
+    return {
+        tag: el.tagName.toLowerCase(),
+        text: el.textContent || '',
+        visible: rect.width > 0 && rect.height > 0 &&
+            getComputedStyle(el).visibility !== 'hidden',
+    };
+}
+"""
 
-def test_basic_detection():
-    """Test detector on common websites"""
-    print("🚀 Testing QA-Copilot Element Detector\n")
-
-    # Initialize detector
-    detector = ElementDetector({
+# Test cases
+TEST_CASES = [
+    {
+        "url": "https://www.google.com",
+        "tests": [
+            ("Click on Search button", "Google Search"),
+            ("Enter text in search box", "search input"),
+            ("Click on I'm Feeling Lucky button", "I'm Feeling Lucky"),
+        ]
+    },
+    {
+        "url": "https://www.saucedemo.com",
+        "tests": [
+            ("Enter username", "username field"),
+            ("Enter password", "password field"),
+            ("Click on Login button", "login button"),
+        ]
+    },
+    {
+        "url": "https://github.com",
+        "tests": [
+            ("Click on Sign in link", "sign in"),
+            ("Click on Sign up button", "sign up"),
+            ("Enter text in search box", "search"),
+        ]
+    }
+]
+
+# One case per (site, description) so pytest-xdist can spread them over workers
+DETECTION_CASES = [
+    (test_site["url"], description, expected)
+    for test_site in TEST_CASES
+    for description, expected in test_site["tests"]
+]
+
+
+def make_detector() -> ElementDetector:
+    return ElementDetector({
         "strategies": ["dom", "heuristic"],
         "timeout": 30,
         "retry_count": 3,
     })
 
-    # Test cases
-    test_cases = [
-        {
-            "url": "https://www.google.com",
-            "tests": [
-                ("Click on Search button", "Google Search"),
-                ("Enter text in search box", "search input"),
-                ("Click on I'm Feeling Lucky button", "I'm Feeling Lucky"),
-            ]
-        },
-        {
-            "url": "https://www.saucedemo.com",
-            "tests": [
-                ("Enter username", "username field"),
-                ("Enter password", "password field"),
-                ("Click on Login button", "login button"),
-            ]
-        },
-        {
-            "url": "https://github.com",
-            "tests": [
-                ("Click on Sign in link", "sign in"),
-                ("Click on Sign up button", "sign up"),
-                ("Enter text in search box", "search"),
-            ]
-        }
-    ]
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
+async def check_site(context: BrowserContext, detector: ElementDetector,
+                     test_site: Dict[str, Any]) -> None:
+    """Run the detection checks for one site in its own page"""
+    url = test_site["url"]
+    # Sites run concurrently, so each one collects its report and prints it
+    # in one go instead of interleaving with the others
+    lines = [f"\n📍 Testing on: {url}", "=" * 50]
 
-        for test_site in test_cases:
-            url = test_site["url"]
-            print(f"\n📍 Testing on: {url}")
-            print("=" * 50)
+    page = await context.new_page()
+    try:
+        await page.goto(url, wait_until='domcontentloaded')
+
+        for description, expected in test_site["tests"]:
+            lines.append(f"\n🔍 Looking for: '{description}'")
 
-            page = browser.new_page()
             try:
-                page.goto(url)
-                page.wait_for_load_state('networkidle', timeout=10000)
+                element = await detector.find_async(page, description)
 
-                for description, expected in test_site["tests"]:
-                    print(f"\n🔍 Looking for: '{description}'")
+                # Get element details
+                info = await element.evaluate(ELEMENT_INFO_JS)
 
-                    try:
-                        element = detector.find(page, description)
+                lines.append(f"   ✅ Found: <{info['tag']}>")
+                lines.append(f"   📝 Text: {info['text'][:50]}")
+                lines.append(f"   👁️  Visible: {info['visible']}")
 
-                        # Get element details
-                        tag = element.evaluate("el => el.tagName.toLowerCase()")
-                        text = element.text_content() or ""
-                        visible = element.is_visible()
+                if VISUAL:
+                    # Highlight the element
+                    await element.evaluate("""el => {
+                        el.style.outline = '3px solid green';
+                        el.style.backgroundColor = 'rgba(0, 255, 0, 0.1)';
+                    }""")
 
-                        print(f"   ✅ Found: <{tag}>")
-                        print(f"   📝 Text: {text[:50]}")
-                        print(f"   👁️  Visible: {visible}")
+                    # Wait a bit to see the highlight
+                    await page.wait_for_timeout(1000)
 
-                        # Highlight the element
-                        element.evaluate("""el => {
-                            el.style.outline = '3px solid green';
-                            el.style.backgroundColor = 'rgba(0, 255, 0, 0.1)';
-                        }""")
+            except Exception as e:
+                lines.append(f"   ❌ Failed: {str(e)[:100]}")
 
-                        # Wait a bit to see the highlight
-                        page.wait_for_timeout(1000)
+        # Take screenshot of final state
+        await page.screenshot(path=f"test_{url.replace('https://', '').replace('/', '_')}.png")
+        lines.append(f"   📸 Screenshot saved")
 
-                    except Exception as e:
-                        print(f"   ❌ Failed: {str(e)[:100]}")
+    except Exception as e:
+        lines.append(f"   ⚠️  Error loading page: {e}")
+    finally:
+        await page.close()
+        print("\n".join(lines))
 
-                # Take screenshot of final state
-                page.screenshot(path=f"test_{url.replace('https://', '').replace('/', '_')}.png")
-                print(f"   📸 Screenshot saved")
 
-            except Exception as e:
-                print(f"   ⚠️  Error loading page: {e}")
-            finally:
-                page.close()
+async def run_basic_detection() -> None:
+    """Test detector on common websites, all sites at once in one browser context"""
+    print("🚀 Testing QA-Copilot Element Detector\n")
+
+    # Initialize detector; it holds no per-page state, so all sites share it
+    detector = make_detector()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=not VISUAL)
+        context = await browser.new_context()
 
-        browser.close()
+        await asyncio.gather(*(check_site(context, detector, test_site) for test_site in TEST_CASES))
+
+        await context.close()
+        await browser.close()
 
     print("\n✨ Testing complete!")
 
 
+@pytest.fixture(scope="module")
+def detector():
+    return make_detector()
+
+
+@pytest.mark.playwright
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("url,description,expected", DETECTION_CASES)
+async def test_basic_detection(page, detector, url, description, expected):
+    """Test detector on common websites"""
+    await page.goto(url, wait_until='domcontentloaded')
+
+    element = await detector.find_async(page, description)
+
+    assert await element.count() > 0, f"No element for '{description}' ({expected}) on {url}"
+
+
 def test_cli_command():
     """Test CLI detection command"""
     print("\n🔧 Testing CLI Command\n")
@@ -159,7 +221,7 @@ if __name__ == "__main__":
     # Run tests
     try:
         test_module_info()
-        test_basic_detection()
+        asyncio.run(run_basic_detection())
         test_cli_command()
     except KeyboardInterrupt:
         print("\n\n⚠️  Test interrupted by user")
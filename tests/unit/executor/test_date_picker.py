@@ -0,0 +1,147 @@
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+from qa_copilot.executor.utils.date_picker import (
+    DatePickerHandler, DateTimeParser, _SET_FIRST_ACCEPTED_VALUE_JS
+)
+
+
+class TestDatePickerHandler:
+    """Test date picker helpers that do not need a browser"""
+
+    @pytest.fixture
+    def handler(self):
+        return DatePickerHandler(Mock())
+
+    def test_parse_picker_header(self, handler):
+        """Test parsing of the various header formats"""
+        assert handler._parse_picker_header("December 2024") == datetime(2024, 12, 1)
+        assert handler._parse_picker_header("Dec\n2024") == datetime(2024, 12, 1)
+        assert handler._parse_picker_header("2024-03") == datetime(2024, 3, 1)
+        assert handler._parse_picker_header("7/2025") == datetime(2025, 7, 1)
+        assert handler._parse_picker_header("Dec 2024Jan 2025") == datetime(2024, 12, 1)
+
+    def test_parse_picker_header_skips_non_month_words(self, handler):
+        """Test that words which are not month names are ignored"""
+        assert handler._parse_picker_header("Year 2024 May 2024") == datetime(2024, 5, 1)
+        assert handler._parse_picker_header("Select date") is None
+
+
+class TestDatePickerHandlerInBrowser:
+    """Test date picker helpers against a real page"""
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_detect_picker_kind(self, page):
+        """Test picker kind detection from the input's surroundings"""
+        await page.set_content("""
+            <div class="ant-picker"><input id="ant"></div>
+            <input id="native" type="date">
+            <div class="MuiFormControl"><input id="material"></div>
+            <input id="custom">
+        """)
+        handler = DatePickerHandler(page)
+
+        for kind in ('ant', 'native', 'material', 'custom'):
+            assert await handler._detect_picker_kind(page.locator(f'#{kind}')) == kind
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_restore_date_panel_steps_down_to_day_view(self, page):
+        """Test that a picker left in the year panel is brought back to the days"""
+        await page.set_content("""
+            <div class="ant-picker-dropdown">
+                <div class="ant-picker-year-panel">
+                    <div class="ant-picker-cell ant-picker-cell-in-view" title="2024">2024</div>
+                </div>
+            </div>
+            <script>
+                const panels = ['ant-picker-month-panel', 'ant-picker-date-panel'];
+                document.addEventListener('click', event => {
+                    if (!event.target.matches('.ant-picker-cell')) return;
+                    event.target.parentElement.className = panels.shift();
+                });
+            </script>
+        """)
+        picker = page.locator('.ant-picker-dropdown')
+
+        await DatePickerHandler(page)._restore_date_panel(picker)
+
+        assert await picker.locator('.ant-picker-date-panel').count() == 1
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_set_first_accepted_value_skips_reset_values(self, page):
+        """Test that a value the input resets on change is not reported as accepted"""
+        await page.set_content("""
+            <input id="range">
+            <script>
+                const input = document.getElementById('range');
+                input.addEventListener('change', () => {
+                    if (!input.value.includes(' to ')) input.value = '';
+                });
+            </script>
+        """)
+
+        matched = await page.locator('#range').evaluate(
+            _SET_FIRST_ACCEPTED_VALUE_JS, ['2024-12-01 - 2024-12-05', '2024-12-01 to 2024-12-05']
+        )
+
+        assert matched == '2024-12-01 to 2024-12-05'
+        assert await page.locator('#range').input_value() == matched
+
+
+class TestDateTimeParser:
+    """Test natural language datetime parsing"""
+
+    @pytest.fixture
+    def reference(self):
+        # Wednesday
+        return datetime(2024, 12, 11, 9, 15)
+
+    def test_relative_days(self, reference):
+        """Test today/tomorrow/yesterday and day offsets"""
+        assert DateTimeParser.parse("today", reference) == reference
+        assert DateTimeParser.parse("tomorrow", reference) == datetime(2024, 12, 12, 9, 15)
+        assert DateTimeParser.parse("yesterday", reference) == datetime(2024, 12, 10, 9, 15)
+        assert DateTimeParser.parse("3 days from now", reference) == datetime(2024, 12, 14, 9, 15)
+        assert DateTimeParser.parse("2 days ago", reference) == datetime(2024, 12, 9, 9, 15)
+
+    def test_next_weekday(self, reference):
+        """Test next <weekday> handling"""
+        assert DateTimeParser.parse("next monday", reference) == datetime(2024, 12, 16, 9, 15)
+        assert DateTimeParser.parse("next wednesday", reference) == datetime(2024, 12, 18, 9, 15)
+
+    def test_relative_weeks_and_months(self, reference):
+        """Test week and month offsets"""
+        assert DateTimeParser.parse("2 weeks from now", reference) == datetime(2024, 12, 25, 9, 15)
+        assert DateTimeParser.parse("1 month from now", reference) == datetime(2025, 1, 10, 9, 15)
+        assert DateTimeParser.parse("1 week ago", reference) == datetime(2024, 12, 4, 9, 15)
+        assert DateTimeParser.parse("tomorrow 1 week from now", reference) == datetime(2024, 12, 19, 9, 15)
+
+    def test_specific_time(self, reference):
+        """Test 'at' time expressions"""
+        assert DateTimeParser.parse("tomorrow at 10:30 am", reference) == datetime(2024, 12, 12, 10, 30)
+        assert DateTimeParser.parse("today at 12:05 am", reference) == datetime(2024, 12, 11, 0, 5)
+        assert DateTimeParser.parse("today at 3 pm", reference) == datetime(2024, 12, 11, 15, 0)
+
+    def test_specific_date(self, reference):
+        """Test MM/DD/YYYY style dates"""
+        assert DateTimeParser.parse("01/15/2025", reference) == datetime(2025, 1, 15, 9, 15)
+        assert DateTimeParser.parse("3-7-25", reference) == datetime(2025, 3, 7, 9, 15)
+
+    def test_parse_reuses_cached_description(self, reference):
+        """Test that repeated phrases hit the cache but keep the reference exact"""
+        DateTimeParser._parse_description.cache_clear()
+
+        first = DateTimeParser.parse("Tomorrow", reference)
+        later = datetime(2024, 12, 11, 9, 15, 42)
+        second = DateTimeParser.parse("tomorrow ", later)
+
+        assert first == datetime(2024, 12, 12, 9, 15)
+        assert second == datetime(2024, 12, 12, 9, 15, 42)
+        assert DateTimeParser._parse_description.cache_info().hits == 1
+
+    def test_format_for_input(self, reference):
+        """Test formatting for different input types"""
+        assert DateTimeParser.format_for_input(reference) == "2024/12/11 09:15"
+        assert DateTimeParser.format_for_input(reference, "iso") == "2024-12-11"
+        assert DateTimeParser.format_for_input(reference, "us") == "12/11/2024"
+        assert DateTimeParser.format_for_input(reference, "unknown") == "2024/12/11 09:15"
@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+from qa_copilot.executor.nlp_step_executor import NLPStepExecutor, SelectorCandidates
+
+
+class TestSelectorCandidates:
+    """Test combined selector candidates"""
+
+    def test_selector_joins_css_and_texts(self):
+        """Test that all candidates end up in one selector list"""
+        candidates = SelectorCandidates(css=('input#a', 'input#b'), texts=('Go',))
+
+        assert candidates.selector == (
+            'input#a, input#b, :is(button, [role="button"]):has-text("Go")'
+        )
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_first_visible_skips_hidden_matches(self, page):
+        """Test that a hidden earlier match does not hide a visible later one"""
+        await page.set_content("""
+            <input id="hidden" type="text" style="display: none">
+            <input id="shown" type="text">
+        """)
+
+        element = await SelectorCandidates(css=('input#hidden', 'input#shown')).first_visible(page)
+
+        assert await element.get_attribute('id') == 'shown'
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_first_visible_uses_fallback(self, page):
+        """Test that the fallback is only used when nothing specific is visible"""
+        await page.set_content('<input id="generic" type="text">')
+        candidates = SelectorCandidates(
+            css=('input#username',),
+            fallback=SelectorCandidates(css=('input[type="text"]',)),
+        )
+
+        element = await candidates.first_visible(page)
+
+        assert await element.get_attribute('id') == 'generic'
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_first_visible_waits_once_for_all_tiers(self, page):
+        """Test that a miss in every tier costs one timeout, not one per tier"""
+        await page.set_content('<p>No form here</p>')
+        candidates = SelectorCandidates(
+            css=('input#username',),
+            fallback=SelectorCandidates(css=('input[type="text"]',)),
+        )
+
+        start = asyncio.get_running_loop().time()
+        assert await candidates.first_visible(page, timeout=500) is None
+        assert asyncio.get_running_loop().time() - start < 0.9
+
+
+class TestSessionCheck:
+    """Test the check that decides whether a restored session is logged in"""
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_late_login_form_rejects_session(self, page):
+        """Test that a login form rendered after the page loads is still seen"""
+        await page.set_content("""
+            <script>
+                setTimeout(() => {
+                    document.body.innerHTML = '<input type="password">';
+                }, 500);
+            </script>
+        """)
+        executor = NLPStepExecutor(page, None, {'logged_in_selector': '.user-menu'})
+
+        assert not await executor._session_is_logged_in()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_landmark_accepts_session(self, page):
+        """Test that the configured logged-in landmark accepts the session"""
+        await page.set_content("""
+            <script>
+                setTimeout(() => {
+                    document.body.innerHTML = '<nav class="user-menu">Me</nav>';
+                }, 500);
+            </script>
+        """)
+        executor = NLPStepExecutor(page, None, {'logged_in_selector': '.user-menu'})
+
+        assert await executor._session_is_logged_in()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_without_landmark_checks_once(self, page):
+        """Test that without a landmark the current page decides straight away"""
+        await page.set_content('<nav>Dashboard</nav>')
+        executor = NLPStepExecutor(page, None, {})
+
+        assert await executor._session_is_logged_in()
+
+        await page.set_content('<input type="password">')
+
+        assert not await executor._session_is_logged_in()